@@ -0,0 +1,8 @@
+"""Bluff card game against the computer
+
+The package root exposes the headless game only; the Tk window lives in
+bluff.gui and is imported on demand by bluff.cli.
+"""
+
+from .cards import RANKS, SUITS, Card, Play
+from .engine import BluffGame, PLAYER, COMPUTER
@@ -0,0 +1,5 @@
+"""Allow running the game with python -m bluff"""
+
+from .cli import main
+
+main()
@@ -0,0 +1,142 @@
+"""Analytics over logged games
+
+Streams game records written by BluffGame.save_move_log and extracts one
+feature row per claim into columnar .npy shards, so questions like "how
+often is a 3-card claim called" can be answered with vectorized queries.
+"""
+
+# Import json for reading logged game records
+import json
+# Import os for creating the output directories
+import os
+# Import re to recognize shard directories left by an earlier extraction
+import re
+# Import shutil for removing those old shard directories
+import shutil
+# Import sys to check the machine's byte order when writing .npy files
+import sys
+# Import array for compact, typed column buffers
+from array import array
+
+# Columns extracted for every move, paired with the array typecode used to store them
+MOVE_FEATURES = [
+    ("game", "q"),              # Position of the game in the record stream
+    ("move", "i"),              # Position of the move within its game
+    ("actor", "b"),             # PLAYER or COMPUTER
+    ("claimed_rank", "b"),      # Index of the announced rank (0 for Twos ... 12 for Aces)
+    ("claim_size", "b"),        # Number of cards played in the claim
+    ("honest", "b"),            # 1 if every played card matched the announced rank
+    ("pile_size", "h"),         # Cards already in the pile when the claim was made
+    ("player_hand", "h"),       # Player's hand size before the claim
+    ("computer_hand", "h"),     # Computer's hand size before the claim
+    ("challenged", "b"),        # 1 if the opponent called bluff on this claim
+    ("challenge_result", "b"),  # 1 if the call was right, 0 if wrong, -1 if not challenged
+]
+
+def format_game_record(moves):
+    """Serialize one game's move records as a line of the JSON lines log
+    
+    moves: List of move records from BluffGame.record_move
+    
+    Returns the line, including its newline, read back by read_game_records
+    """
+    return json.dumps({"moves": moves}) + "\n"
+
+def read_game_records(path):
+    """Stream logged games from a JSON lines file, one game at a time
+    
+    path: File of lines written by format_game_record
+    
+    Yields the list of move records of each game
+    """
+    with open(path, encoding="utf-8") as log_file:
+        for line in log_file:
+            # Skip blank lines left by interrupted writes
+            if line.strip():
+                yield json.loads(line)["moves"]
+
+def iter_move_features(games):
+    """Flatten a stream of games into one feature row per move
+    
+    games: Iterable of move record lists (e.g. from read_game_records)
+    
+    Yields tuples ordered like MOVE_FEATURES
+    """
+    for game_number, moves in enumerate(games):
+        for move_number, move in enumerate(moves):
+            yield (
+                game_number,
+                move_number,
+                move["actor"],
+                move["claimed_rank"],
+                move["claim_size"],
+                int(move["honest"]),
+                move["pile_size"],
+                move["player_hand"],
+                move["computer_hand"],
+                int(move["challenged"]),
+                move["challenge_result"],
+            )
+
+def write_npy(path, column):
+    """Write a one-dimensional integer array as a NumPy .npy file
+    
+    path: Destination file
+    column: array.array of signed integers
+    """
+    # Single byte values have no byte order, wider ones use the machine's order
+    byte_order = "|" if column.itemsize == 1 else ("<" if sys.byteorder == "little" else ">")
+    header = "{'descr': '%si%d', 'fortran_order': False, 'shape': (%d,), }" % (
+        byte_order, column.itemsize, len(column))
+    # Pad the header with spaces so the data starts on a 64 byte boundary
+    header += " " * (63 - (10 + len(header)) % 64) + "\n"
+    with open(path, "wb") as npy_file:
+        # Magic string and format version 1.0
+        npy_file.write(b"\x93NUMPY\x01\x00")
+        # Header length as a little-endian 16 bit integer
+        npy_file.write(len(header).to_bytes(2, "little"))
+        npy_file.write(header.encode("latin1"))
+        column.tofile(npy_file)
+
+def write_feature_shards(games, out_dir, shard_size=65536):
+    """Extract per-move features and write them as columnar .npy shards
+    
+    games: Iterable of move record lists, consumed lazily
+    out_dir: Directory receiving shard_00000/, shard_00001/, ... with one .npy file per column;
+             shard directories from an earlier run are removed first
+    shard_size: Maximum number of moves per shard, which bounds memory use
+    
+    Returns the number of shards written
+    """
+    # Remove old shards so a shorter run cannot leave stale ones behind
+    if os.path.isdir(out_dir):
+        for entry in os.listdir(out_dir):
+            old_shard = os.path.join(out_dir, entry)
+            if re.fullmatch(r"shard_\d{5}", entry) and os.path.isdir(old_shard):
+                shutil.rmtree(old_shard)
+    
+    # One typed buffer per column, reused for every shard
+    columns = [array(typecode) for _, typecode in MOVE_FEATURES]
+    shard_count = 0
+    
+    def flush():
+        # Write the buffered rows as one shard and empty the buffers
+        shard_dir = os.path.join(out_dir, f"shard_{shard_count:05d}")
+        os.makedirs(shard_dir, exist_ok=True)
+        for (name, _), column in zip(MOVE_FEATURES, columns):
+            write_npy(os.path.join(shard_dir, f"{name}.npy"), column)
+            del column[:]
+    
+    for row in iter_move_features(games):
+        for column, value in zip(columns, row):
+            column.append(value)
+        # Write a shard as soon as the buffers are full
+        if len(columns[0]) == shard_size:
+            flush()
+            shard_count += 1
+    
+    # Write the remaining rows as a final, smaller shard
+    if len(columns[0]) > 0:
+        flush()
+        shard_count += 1
+    return shard_count
@@ -0,0 +1,65 @@
+"""Cards and plays of the bluff card game
+
+Pure data with no GUI dependency, shared by the engine, the analytics
+pipeline and the renderer.
+"""
+
+# Define all possible card ranks in order from lowest to highest
+RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+# Define all possible card suits (red suits first, then black suits)
+SUITS = ["Hearts", "Diamonds", "Clubs", "Spades"]
+
+class Card:
+    # Initialize a new card with a rank (2-A) and suit (Hearts, Diamonds, Clubs, Spades)
+    def __init__(self, rank, suit):
+        # Store the card's rank (2, 3, 4, 5, 6, 7, 8, 9, 10, J, Q, K, or A)
+        self.rank = rank
+        # Store the card's suit (Hearts, Diamonds, Clubs, or Spades)
+        self.suit = suit
+    
+    # Define string representation of the card (e.g., "2 of Hearts")
+    def __str__(self):
+        # Return formatted string with rank and suit
+        return f"{self.rank} of {self.suit}"
+    
+    # Get the card's symbol representation (e.g., "2♥")
+    def get_symbol(self):
+        # Dictionary mapping suit names to their unicode symbols
+        suit_symbols = {
+            "Hearts": "♥",    # Red heart symbol
+            "Diamonds": "♦",  # Red diamond symbol
+            "Clubs": "♣",     # Black club symbol
+            "Spades": "♠"     # Black spade symbol
+        }
+        # Return the card's rank followed by its suit symbol
+        return f"{self.rank}{suit_symbols[self.suit]}"
+
+class Play:
+    """One claim on the pile: who made it, the announced rank and where its cards sit in the pile
+    
+    The cards of a play are pile[start:end], so they can be looked up
+    without scanning the rest of the pile.
+    """
+    # Initialize a play from the actor, the claimed rank and the pile offsets of its cards
+    def __init__(self, actor, rank, start, end):
+        # Store who made the claim (engine.PLAYER or engine.COMPUTER)
+        self.actor = actor
+        # Store the rank that was announced for these cards
+        self.rank = rank
+        # Store the pile index of the first card of this play
+        self.start = start
+        # Store the pile index just after the last card of this play
+        self.end = end
+    
+    # Number of cards the claim contained
+    @property
+    def count(self):
+        return self.end - self.start
+    
+    # Get the cards of this play from the pile they were added to
+    def cards(self, pile):
+        return pile[self.start:self.end]
+    
+    # Check whether every card of this play matches the announced rank
+    def is_honest(self, pile):
+        return all(card.rank == self.rank for card in self.cards(pile))
@@ -0,0 +1,60 @@
+"""Command line entry point of the bluff card game
+
+Each option imports only the modules it needs, so headless runs
+(analytics, render benchmark, simulation) never load tkinter.
+"""
+
+# Import argparse for the command line options
+import argparse
+
+def main(argv=None):
+    # Read the command line options
+    parser = argparse.ArgumentParser(description="Bluff card game against the computer")
+    parser.add_argument("--log", help="append finished games to this JSON lines file")
+    parser.add_argument("--extract-features", nargs=2, metavar=("LOG", "OUT_DIR"),
+                        help="write per-move features of a game log as .npy shards and exit")
+    parser.add_argument("--shard-size", type=int, default=65536,
+                        help="maximum number of moves per feature shard")
+    parser.add_argument("--render-benchmark", type=int, metavar="HAND_SIZE",
+                        help="count draw operations per redraw of a hand this large and exit")
+    parser.add_argument("--clock", type=float, metavar="SECONDS",
+                        help="give each player this much thinking time for the whole game")
+    parser.add_argument("--increment", type=float, default=0, metavar="SECONDS",
+                        help="add this much time to a player's clock after every move")
+    parser.add_argument("--bot-deadline", type=float, metavar="SECONDS",
+                        help="maximum time for one computer decision before it falls back to a quick move")
+    parser.add_argument("--simulate", type=int, metavar="GAMES",
+                        help="play this many headless games, append them to --log and exit")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the first simulated game")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes for --simulate")
+    args = parser.parse_args(argv)
+    
+    # Run the analytics pipeline without opening a window
+    if args.extract_features:
+        from .analytics import read_game_records, write_feature_shards
+        log_path, out_dir = args.extract_features
+        shards = write_feature_shards(read_game_records(log_path), out_dir, args.shard_size)
+        print(f"Wrote {shards} shard(s) to {out_dir}")
+        return
+    
+    # Measure hand redraws on the recording backend without opening a window
+    if args.render_benchmark is not None:
+        from .render import benchmark_redraw
+        operations, seconds = benchmark_redraw(args.render_benchmark)
+        print(f"{operations} draw operations, {seconds * 1000:.3f} ms per redraw")
+        return
+    
+    # Play bot-vs-computer games without opening a window
+    if args.simulate is not None:
+        if not args.log:
+            parser.error("--simulate needs --log to write the games to")
+        from .simulate import simulate_games, write_game_log
+        count = write_game_log(simulate_games(args.simulate, args.seed, args.workers), args.log)
+        print(f"Wrote {count} finished game(s) to {args.log}")
+        return
+    
+    # Load tkinter only now that a window is needed
+    from .gui import main as run_gui
+    run_gui(args.log, args.clock, args.increment, args.bot_deadline)
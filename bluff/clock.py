@@ -0,0 +1,57 @@
+"""Per-move chess clocks for both seats
+
+A GameClock gives each player a time bank that only runs during their
+own moves. With a Fischer increment, the increment is added to a
+player's bank after every move they finish in time.
+"""
+
+# Import time for the monotonic clock the banks are measured with
+import time
+
+class GameClock:
+    # Create a clock with the same time bank for both players
+    def __init__(self, initial_seconds, increment_seconds=0, time_source=time.monotonic):
+        # Store the seconds added after every finished move (Fischer increment)
+        self.increment = increment_seconds
+        # Store the function returning the current time in seconds
+        self.time_source = time_source
+        # Seconds left for each player, indexed by PLAYER / COMPUTER
+        self.remaining = [initial_seconds, initial_seconds]
+        # Player whose clock is running, None while both are stopped
+        self.running = None
+        # Time the running clock was started at
+        self.started_at = 0.0
+    
+    # Start the clock of the player about to move
+    def start(self, actor):
+        self.running = actor
+        self.started_at = self.time_source()
+    
+    def stop(self):
+        """Stop the running clock and charge the move to its player
+        
+        Returns boolean:
+        True if the move was finished in time, False if the player ran out of time
+        """
+        if self.running is None:
+            return True
+        actor = self.running
+        self.remaining[actor] -= self.time_source() - self.started_at
+        self.running = None
+        if self.remaining[actor] <= 0:
+            self.remaining[actor] = 0
+            return False
+        # Only moves finished in time earn the increment
+        self.remaining[actor] += self.increment
+        return True
+    
+    # Get the seconds a player has left, counting the move in progress
+    def time_left(self, actor):
+        left = self.remaining[actor]
+        if self.running == actor:
+            left -= self.time_source() - self.started_at
+        return max(0, left)
+    
+    # Check whether a player has used up their time
+    def is_flagged(self, actor):
+        return self.time_left(actor) <= 0
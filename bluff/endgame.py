@@ -0,0 +1,281 @@
+"""Game-tree search of small endgames for the computer player
+
+Once both hands are small the rest of the game is small enough to
+search. Positions are packed as rank-count tuples (player's hand,
+computer's hand, pile), the rank being played, who moves and whether
+the computer's last claim was honest. Values are cached in a
+transposition table with LRU eviction.
+
+The search follows the engine's turn order: the player plays or calls
+the computer's last claim, the computer may call the player's claim,
+then the computer plays. Claims hold 1 to 4 cards, as in the rules.
+Positions where a hand grows past hand_limit (usually from taking the
+pile) leave the endgame and are scored by hand sizes instead of
+searched further. The result is exact only when every line ends the
+game inside the endgame within the searched depth (EndgameSolver.exact
+tells); otherwise it is a depth-limited search with hand-size scoring.
+
+The computer cannot see the player's cards, so the engine samples
+deals consistent with what the computer knows and the solver picks the
+action with the best total value over the samples. Iterative deepening
+keeps the answer of the deepest search finished within the time
+budget.
+
+A new EndgameSolver is made for every decision, so a search abandoned
+by the engine's deadline never shares its table with the next one, and
+nothing is kept between moves. While a decision runs, memory is bounded
+by table_size: about 650 bytes per entry, so 2.6 MB with the default
+4096 entries, on top of the process-wide play_options cache.
+"""
+
+# Import time for the per-move time budget
+import time
+# Import OrderedDict for the LRU transposition table
+from collections import OrderedDict
+# Import lru_cache to enumerate each hand's possible claims only once
+from functools import lru_cache
+
+from .cards import RANKS
+
+# Both hands must be this small for the computer to switch to the solver
+ENDGAME_HAND_SIZE = 6
+# Number of sampled deals of the player's hidden cards searched per decision
+ENDGAME_SAMPLES = 8
+# Seconds one decision may search when no tighter limit applies
+ENDGAME_TIME_BUDGET = 0.2
+# Largest number of cards in one claim
+MAX_CLAIM = 4
+
+# Who moves in a searched position
+PLAYER_MOVE = 0    # Player plays, or calls the computer's last claim
+COMPUTER_CALL = 1  # Computer decides whether to call the player's claim
+COMPUTER_PLAY = 2  # Computer plays
+
+class OutOfTime(Exception):
+    """Raised inside the search when the time budget is used up"""
+
+@lru_cache(maxsize=4096)
+def play_options(hand):
+    """List every claim of 1 to MAX_CLAIM cards that can be made from a hand
+    
+    hand: Tuple of 13 rank counts
+    
+    Returns list of rank-count tuples
+    """
+    options = []
+    chosen = []
+    
+    def extend(index, size):
+        # Every rank decided: keep the claim unless it is empty
+        if index == len(hand):
+            if size > 0:
+                options.append(tuple(chosen))
+            return
+        for count in range(min(hand[index], MAX_CLAIM - size) + 1):
+            chosen.append(count)
+            extend(index + 1, size + count)
+            chosen.pop()
+    
+    extend(0, 0)
+    return options
+
+# Add two rank-count tuples
+def add_counts(a, b):
+    return tuple(x + y for x, y in zip(a, b))
+
+# Subtract rank-count tuple b from a
+def sub_counts(a, b):
+    return tuple(x - y for x, y in zip(a, b))
+
+# Check whether a claim only holds cards of the claimed rank
+def is_honest(claim, rank_index):
+    return sum(claim) == claim[rank_index]
+
+class EndgameSolver:
+    # Create a solver for one decision, with an empty transposition table
+    def __init__(self, table_size=4096, hand_limit=ENDGAME_HAND_SIZE):
+        # Store the maximum number of cached positions
+        self.table_size = table_size
+        # Store the hand size past which positions are scored instead of searched
+        self.hand_limit = hand_limit
+        # Cached (value, cut_off) pairs by packed position, least recently used first
+        self.table = OrderedDict()
+        # Whether the search so far scored any line before the game ended
+        self.cut_off = False
+        # Whether the last best_action result is backed by game ends only
+        self.exact = False
+        # Number of positions visited, for checking the clock now and then
+        self.nodes = 0
+        # perf_counter time at which the current search must stop
+        self.deadline = 0.0
+    
+    def score(self, player, computer):
+        """Estimate a position that is not searched further, between -1 and 1
+        
+        Positive values favour the computer; fewer cards than the opponent is better.
+        """
+        player_size = sum(player)
+        computer_size = sum(computer)
+        return 0.5 * (player_size - computer_size) / (player_size + computer_size)
+    
+    def value(self, node, player, computer, pile, rank_index, honest, depth):
+        """Value of a position for the computer, searched depth moves deep
+        
+        node: PLAYER_MOVE, COMPUTER_CALL or COMPUTER_PLAY
+        player, computer, pile: Rank-count tuples
+        rank_index: Index of the rank being claimed
+        honest: Whether the pending claim (the computer's for PLAYER_MOVE,
+                the player's for COMPUTER_CALL) is honest, None if there is none
+        depth: Moves left to search
+        
+        Returns a value above 1 for a computer win, below -1 for a loss
+        (larger when sooner), or score() for unfinished positions
+        """
+        # The player with an empty hand wins once the computer has played
+        if node == COMPUTER_PLAY and sum(player) == 0:
+            return -1 - 0.01 * depth
+        # Lines scored before the game ends make the result inexact, and a
+        # deeper search may find better lines that avoid them
+        if depth == 0 or sum(player) > self.hand_limit or sum(computer) > self.hand_limit:
+            self.cut_off = True
+            return self.score(player, computer)
+        
+        # Look the position up in the transposition table
+        key = (node, player, computer, pile, rank_index, honest, depth)
+        if key in self.table:
+            self.table.move_to_end(key)
+            result, cut_off = self.table[key]
+            self.cut_off = self.cut_off or cut_off
+            return result
+        # Track cut-offs below this position separately for the table entry
+        outer_cut_off = self.cut_off
+        self.cut_off = False
+        
+        # Check the time budget every 256 positions
+        self.nodes += 1
+        if self.nodes % 256 == 0 and time.perf_counter() > self.deadline:
+            raise OutOfTime()
+        
+        empty = (0,) * len(RANKS)
+        next_rank = (rank_index + 1) % len(RANKS)
+        if node == PLAYER_MOVE:
+            # The player picks the move that is worst for the computer
+            values = [
+                self.value(COMPUTER_CALL, sub_counts(player, claim), computer,
+                           add_counts(pile, claim), rank_index, is_honest(claim, rank_index), depth - 1)
+                for claim in play_options(player)
+            ]
+            if honest is not None:
+                # Calling: the computer takes the pile if it bluffed, else the player does
+                if honest:
+                    taken = (add_counts(player, pile), computer)
+                else:
+                    taken = (player, add_counts(computer, pile))
+                values.append(self.value(PLAYER_MOVE, taken[0], taken[1], empty,
+                                         next_rank, None, depth - 1))
+            result = min(values)
+        elif node == COMPUTER_CALL:
+            # Not calling lets the claim stand
+            values = [self.value(COMPUTER_PLAY, player, computer, pile, rank_index, None, depth - 1)]
+            # Calling: the player takes the pile if they bluffed, else the computer does
+            if honest:
+                taken = (player, add_counts(computer, pile))
+            else:
+                taken = (add_counts(player, pile), computer)
+            values.append(self.value(COMPUTER_PLAY, taken[0], taken[1], empty,
+                                     next_rank, None, depth - 1))
+            result = max(values)
+        else:
+            values = []
+            for claim in play_options(computer):
+                remaining = sub_counts(computer, claim)
+                # The computer wins as soon as its hand is empty
+                if sum(remaining) == 0:
+                    values.append(1 + 0.01 * depth)
+                else:
+                    values.append(self.value(PLAYER_MOVE, player, remaining, add_counts(pile, claim),
+                                             rank_index, is_honest(claim, rank_index), depth - 1))
+            result = max(values) if values else self.score(player, computer)
+        
+        # Store the value, evicting the least recently used position when full
+        self.table[key] = (result, self.cut_off)
+        self.cut_off = outer_cut_off or self.cut_off
+        if len(self.table) > self.table_size:
+            self.table.popitem(last=False)
+        return result
+    
+    def best_action(self, actions, evaluate, time_budget, max_depth=60):
+        """Deepen the search until time runs out and return the best action
+        
+        actions: Candidate actions at the root
+        evaluate: Function (action, depth) giving the summed value over all samples
+        time_budget: Seconds the search may take
+        max_depth: Deepest search tried
+        
+        Returns the best action of the deepest finished search, or None if
+        not even a one-move search finished in time
+        """
+        self.deadline = time.perf_counter() + time_budget
+        best = None
+        try:
+            for depth in range(1, max_depth + 1):
+                self.cut_off = False
+                values = [evaluate(action, depth) for action in actions]
+                best = actions[values.index(max(values))]
+                # Every line reached the end of the game, so deeper searches give the same answer
+                self.exact = not self.cut_off
+                if self.exact:
+                    break
+        except OutOfTime:
+            pass
+        return best
+    
+    def choose_call(self, samples, time_budget):
+        """Decide whether the computer calls the player's claim
+        
+        samples: List of (player, computer, pile, rank_index, honest) deals
+                 consistent with what the computer knows, honest being the player's last claim
+        time_budget: Seconds the search may take
+        
+        Returns True to call, False to let the claim stand, None if out of time
+        """
+        def evaluate(call, depth):
+            total = 0
+            for player, computer, pile, rank_index, honest in samples:
+                if call:
+                    # The loser of the call takes the pile and play moves to the next rank
+                    if honest:
+                        computer = add_counts(computer, pile)
+                    else:
+                        player = add_counts(player, pile)
+                    pile = (0,) * len(RANKS)
+                    rank_index = (rank_index + 1) % len(RANKS)
+                total += self.value(COMPUTER_PLAY, player, computer, pile, rank_index, None, depth - 1)
+            return total
+        
+        return self.best_action([False, True], evaluate, time_budget)
+    
+    def choose_play(self, samples, time_budget):
+        """Choose the computer's claim
+        
+        samples: List of (player, computer, pile, rank_index, honest) deals
+                 consistent with what the computer knows (computer is the same in all)
+        time_budget: Seconds the search may take
+        
+        Returns the rank counts of the cards to play, or None if out of time
+        """
+        def evaluate(claim, depth):
+            total = 0
+            for player, computer, pile, rank_index, _ in samples:
+                remaining = sub_counts(computer, claim)
+                if sum(player) == 0:
+                    # The player already emptied their hand and wins after this play
+                    total += -1 - 0.01 * depth
+                elif sum(remaining) == 0:
+                    total += 1 + 0.01 * depth
+                else:
+                    total += self.value(PLAYER_MOVE, player, remaining, add_counts(pile, claim),
+                                        rank_index, is_honest(claim, rank_index), depth - 1)
+            return total
+        
+        return self.best_action(play_options(samples[0][1]), evaluate, time_budget)
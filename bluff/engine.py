@@ -0,0 +1,565 @@
+"""Game state and rules of the bluff card game
+
+BluffGame holds the deck, both hands, the pile and the computer's
+strategy. It never imports tkinter, so simulations and analytics can
+run it headless; the GUI drives it and shows its messages.
+"""
+
+# Import random module for shuffling cards and making random choices
+import random
+# Import time for measuring how long the computer takes to decide
+import time
+# Import futures to stop waiting for a strategy that misses its deadline
+from concurrent import futures
+
+from .analytics import format_game_record
+from .cards import RANKS, SUITS, Card, Play
+from .endgame import ENDGAME_HAND_SIZE, ENDGAME_SAMPLES, ENDGAME_TIME_BUDGET, EndgameSolver
+from .history import MoveHistory, pack_call, pack_play, pack_state, rank_counts
+
+# Identify who made a move
+PLAYER = 0    # The human player
+COMPUTER = 1  # The computer opponent
+
+class BluffGame:
+    # Deal a new game; notify receives (title, message) for every game event
+    def __init__(self, notify=None, log_path=None, rng=random, clock=None, bot_deadline=None,
+                 history=None):
+        # Store the callback showing game messages (ignored when None)
+        self.notify = notify or (lambda title, message: None)
+        # Store the file finished games are appended to (None disables logging)
+        self.log_path = log_path
+        # Store the random source (the random module, or a seeded random.Random)
+        self.rng = rng
+        # Store the GameClock limiting both players' thinking time (None for untimed games)
+        self.clock = clock
+        # Store the seconds the computer may spend on one decision (None for no limit)
+        self.bot_deadline = bot_deadline
+        # List of (decision, seconds, in_time) tuples, one per computer decision
+        self.decision_latencies = []
+        # Thread the computer's strategy runs in when a deadline is enforced
+        self.executor = None
+        # Player who ran out of time, None while both have time left
+        self.flagged = None
+        # Whether a move is being resolved (hands and pile may be mid-change)
+        self.in_move = False
+        # Store the bounded MoveHistory every play and call is recorded in
+        self.history = history if history is not None else MoveHistory()
+        
+        # Create a complete deck of 52 cards using list comprehension
+        # Creates one Card object for each combination of rank and suit
+        self.deck = [Card(rank, suit) for rank in RANKS for suit in SUITS]
+        # Randomly shuffle the deck of cards
+        self.rng.shuffle(self.deck)
+        
+        # Initialize empty lists for game components
+        self.player_hand = []      # List to store player's cards
+        self.computer_hand = []    # List to store computer's cards
+        self.pile = []            # List to store cards played in current round
+        self.plays = []           # Stack of Play objects, one per claim in the pile
+        self.current_rank = "2"    # Start game with rank of 2
+        self.move_log = []         # List of feature records, one per claim made
+        self.game_logged = False   # Whether this game was already saved to the log file
+        
+        # Deal cards alternately to player and computer until deck is empty
+        while len(self.deck) > 0:
+            # Deal one card to player if deck isn't empty
+            if len(self.deck) > 0:
+                self.player_hand.append(self.deck.pop())
+            # Deal one card to computer if deck isn't empty
+            if len(self.deck) > 0:
+                self.computer_hand.append(self.deck.pop())
+        
+        # Sort player's initial hand by rank first, then by suit
+        # Uses lambda function to create sort key from rank and suit indices
+        self.player_hand.sort(key=lambda card: (RANKS.index(card.rank), SUITS.index(card.suit)))
+        
+        # The player moves first
+        if self.clock:
+            self.clock.start(PLAYER)
+
+    def play_cards(self, selected_cards):
+        """Handle player's attempt to play cards
+        
+        selected_cards: Indices into player_hand of the cards to play
+        
+        Validates the play, adds cards to the pile, and handles computer's response.
+        Cards are removed from player's hand and added to the play pile.
+        Computer may call bluff after cards are played.
+        
+        Returns boolean:
+        True if the turn is over (cards played or time ran out), False if nothing was played
+        """
+        # No more moves once someone ran out of time, and none while another
+        # move is still being resolved (a message can process a second click)
+        if self.flagged is not None or self.in_move:
+            return False
+        # Check if any cards are selected to play
+        if not selected_cards:
+            self.notify("Error", "Please select cards to play!")
+            return False
+        # Stop the player's clock, the move is lost if it came too late
+        if not self.end_move(PLAYER):
+            return True
+            
+        # Keep check_game_over quiet until the whole move is resolved
+        self.in_move = True
+        try:
+            # Get the selected cards and remove them from player's hand
+            # Sort in reverse order to avoid index issues when removing multiple cards
+            cards_to_play = [self.player_hand[i] for i in sorted(selected_cards, reverse=True)]
+            self.push_play(PLAYER, cards_to_play, self.player_hand)
+        
+            # Sort remaining cards in player's hand by rank and suit
+            self.player_hand.sort(key=lambda card: (RANKS.index(card.rank), SUITS.index(card.suit)))
+        
+            # Record the claim before the computer responds to it
+            record = self.record_move(PLAYER, cards_to_play)
+        
+            # The computer's clock runs while it responds and takes its turn
+            self.start_move(COMPUTER)
+        
+            # Let computer decide whether to call bluff (never call if the decision is too slow)
+            if self.timed_decision("call", lambda: self.computer_decide_bluff(len(cards_to_play)),
+                                   lambda: False):
+                # Computer decides to call bluff
+                self.notify("Bluff Called!", "Computer calls BLUFF!")
+                # Check if any played cards don't match the current rank
+                bluff_called = not self.plays[-1].is_honest(self.pile)
+                # Record the challenge and whether the computer was right
+                record["challenged"] = True
+                record["challenge_result"] = int(bluff_called)
+            
+                # Record the call and who takes the pile
+                self.record_call(COMPUTER, PLAYER if bluff_called else COMPUTER)
+            
+                if bluff_called:
+                    # Player was caught bluffing - must take all cards
+                    self.notify("Caught!", "You were caught bluffing! Taking the pile...")
+                    self.player_hand.extend(self.pile)
+                else:
+                    # Computer was wrong - must take all cards
+                    self.notify("Wrong!", "Computer was wrong! They take the pile...")
+                    self.computer_hand.extend(self.pile)
+                # Clear the pile after cards are taken
+                self.clear_pile()
+                # Advance to next rank only after pile is taken
+                self.next_rank()
+        
+            # Computer takes their turn
+            self.computer_turn()
+            # Hand the move back to the player if the computer finished in time
+            if self.end_move(COMPUTER):
+                self.start_move(PLAYER)
+            return True
+        finally:
+            self.in_move = False
+
+    def computer_decide_bluff(self, num_cards_claimed):
+        """Determine if computer should call player's bluff
+        
+        num_cards_claimed: Number of cards player claims to be playing
+            
+        Returns boolean:
+        True if computer decides to call bluff, False otherwise
+        """
+        # Search the endgame instead of guessing once both hands are small
+        if self.in_endgame():
+            # A fresh solver per decision keeps abandoned searches apart
+            call = EndgameSolver().choose_call(self.endgame_samples(), self.endgame_time_budget())
+            if call is not None:
+                return call
+        
+        # Threshold for random bluff calling (70% chance to let it pass)
+        probability_threshold = 0.7
+        
+        # Count how many cards of current rank computer has
+        cards_of_rank = len([card for card in self.computer_hand if card.rank == self.current_rank])
+        
+        # Calculate maximum possible cards player could have of this rank
+        # (4 cards per rank in deck - cards computer has)
+        total_possible = 4 - cards_of_rank
+        
+        # Always call bluff if player claims more cards than possible
+        if num_cards_claimed > total_possible:
+            return True
+        # Randomly call bluff on larger plays (3+ cards) with 30% chance
+        elif num_cards_claimed > 2 and self.rng.random() > probability_threshold:
+            return True
+        # Otherwise, accept the play
+        return False
+
+    def choose_computer_cards(self):
+        """Choose the cards for the computer's turn without changing the game
+        
+        Computer will either:
+        1. Play matching cards if it has them
+        2. Bluff with random cards if it has no matching cards
+        
+        Returns list of cards to play
+        """
+        # Search the endgame instead of guessing once both hands are small
+        if self.in_endgame():
+            # A fresh solver per decision keeps abandoned searches apart
+            claim = EndgameSolver().choose_play(self.endgame_samples(), self.endgame_time_budget())
+            if claim is not None:
+                return self.cards_for_counts(claim)
+        
+        # Find all cards in computer's hand that match the current rank
+        cards_of_rank = [card for card in self.computer_hand if card.rank == self.current_rank]
+        
+        if cards_of_rank:
+            # If computer has matching cards, randomly choose how many to play
+            num_to_play = self.rng.randint(1, len(cards_of_rank))
+            # Take the first n cards from matching cards
+            return cards_of_rank[:num_to_play]
+        # If no matching cards, bluff with 1-3 random cards
+        num_to_play = self.rng.randint(1, min(3, len(self.computer_hand)))
+        # Randomly select cards to bluff with
+        return self.rng.sample(self.computer_hand, num_to_play)
+
+    def in_endgame(self):
+        """Check whether both hands are small enough for the endgame solver"""
+        return len(self.player_hand) <= ENDGAME_HAND_SIZE and len(self.computer_hand) <= ENDGAME_HAND_SIZE
+
+    def endgame_time_budget(self):
+        """Seconds the endgame solver may search for one decision
+        
+        Stays well inside bot_deadline and the computer's remaining clock time
+        """
+        budget = ENDGAME_TIME_BUDGET
+        if self.bot_deadline is not None:
+            budget = min(budget, 0.8 * self.bot_deadline)
+        if self.clock:
+            budget = min(budget, self.clock.time_left(COMPUTER) / 10)
+        return budget
+
+    def endgame_samples(self):
+        """Sample deals of the cards the computer cannot see
+        
+        The computer's hand and the cards it put on the pile are fixed.
+        Every other card is in the player's hand or among the player's
+        claims on the pile, and those are dealt out uniformly at random.
+        This only approximates what the computer knows: cards it saw go to
+        the player (revealed on a call, or its own cards in a pile the
+        player took) are not tracked, and claims are not weighted by how
+        often the player bluffs, so unlikely deals count as much as likely ones.
+        
+        Returns list of (player, computer, pile, rank_index, honest) tuples of
+        rank counts, honest being whether the last claim on the pile was honest
+        """
+        rank_index = RANKS.index(self.current_rank)
+        computer = tuple(rank_counts(self.computer_hand))
+        # Cards whose place is known: the computer's hand and its own claims
+        known = list(computer)
+        for play in self.plays:
+            if play.actor == COMPUTER:
+                for index, count in enumerate(rank_counts(play.cards(self.pile))):
+                    known[index] += count
+        # Every other card of the deck, as rank indices
+        unseen = [index for index in range(len(RANKS)) for _ in range(len(SUITS) - known[index])]
+        
+        samples = []
+        for _ in range(ENDGAME_SAMPLES):
+            self.rng.shuffle(unseen)
+            pile = [0] * len(RANKS)
+            honest = None
+            dealt = 0
+            for play in self.plays:
+                if play.actor == COMPUTER:
+                    cards = [RANKS.index(card.rank) for card in play.cards(self.pile)]
+                else:
+                    # Deal the player's claim from the unseen cards
+                    cards = unseen[dealt:dealt + play.count]
+                    dealt += play.count
+                for index in cards:
+                    pile[index] += 1
+                honest = all(index == RANKS.index(play.rank) for index in cards)
+            # The rest of the unseen cards make up the player's hand
+            player = [0] * len(RANKS)
+            for index in unseen[dealt:]:
+                player[index] += 1
+            samples.append((tuple(player), computer, tuple(pile), rank_index, honest))
+        return samples
+
+    def cards_for_counts(self, claim):
+        """Pick cards from the computer's hand matching a claim's rank counts
+        
+        Returns list of cards
+        """
+        remaining = list(claim)
+        cards = []
+        for card in self.computer_hand:
+            index = RANKS.index(card.rank)
+            if remaining[index] > 0:
+                cards.append(card)
+                remaining[index] -= 1
+        return cards
+
+    def fallback_computer_cards(self):
+        """Pick a single card instantly, used when the strategy misses its deadline
+        
+        Returns list with one card of the current rank if the computer has one, else its first card
+        """
+        for card in self.computer_hand:
+            if card.rank == self.current_rank:
+                return [card]
+        return [self.computer_hand[0]]
+
+    def computer_turn(self):
+        """Handle the computer's turn in the game
+        
+        Returns boolean:
+        True if computer is bluffing, False if playing honestly
+        """
+        # Let the strategy choose, falling back to a single card if it is too slow
+        cards_to_play = self.timed_decision("play", self.choose_computer_cards,
+                                            self.fallback_computer_cards)
+        # Bluffing if any card doesn't match the current rank
+        bluffing = any(card.rank != self.current_rank for card in cards_to_play)
+        
+        # Remove played cards from computer's hand and add to pile
+        self.push_play(COMPUTER, cards_to_play, self.computer_hand)
+        
+        # Record the claim so a later call from the player can be added to it
+        self.record_move(COMPUTER, cards_to_play)
+        
+        # Show message about computer's play
+        self.notify(
+            "Computer's Turn",
+            f"Computer plays {len(cards_to_play)} card(s) of rank {self.current_rank}"
+        )
+        
+        # Return whether computer was bluffing
+        return bluffing
+
+    def timed_decision(self, name, decide, fallback):
+        """Run one computer decision, measure it and enforce bot_deadline
+        
+        name: Label stored with the latency ("call" or "play")
+        decide: Function making the decision; must not change the game
+        fallback: Function giving an instant answer if decide misses the deadline
+        
+        Returns the decision, or the fallback's answer if decide was too slow
+        """
+        start = time.perf_counter()
+        if self.bot_deadline is None:
+            # No deadline: decide directly in this thread
+            result = decide()
+            in_time = True
+        else:
+            # Run the strategy in a worker thread so waiting for it can be cut short
+            if self.executor is None:
+                self.executor = futures.ThreadPoolExecutor(max_workers=1)
+            future = self.executor.submit(decide)
+            try:
+                result = future.result(timeout=self.bot_deadline)
+                in_time = True
+            except futures.TimeoutError:
+                # Abandon the slow thread and its answer, the next decision gets a fresh one
+                self.executor.shutdown(wait=False)
+                self.executor = None
+                result = fallback()
+                in_time = False
+        self.decision_latencies.append((name, time.perf_counter() - start, in_time))
+        return result
+
+    def start_move(self, actor):
+        """Start the actor's clock, if the game is timed"""
+        if self.clock:
+            self.clock.start(actor)
+
+    def end_move(self, actor):
+        """Stop the actor's clock at the end of their move
+        
+        Returns boolean:
+        True if the move was in time (or the game is untimed), False if the actor ran out of time
+        """
+        if not self.clock or self.clock.stop():
+            return True
+        self.flagged = actor
+        self.notify("Out of time!", "You ran out of time!" if actor == PLAYER else "Computer ran out of time!")
+        return False
+
+    def call_bluff(self):
+        """Handle player's attempt to call computer's bluff
+        
+        Checks if the computer's last play was honest:
+        - If computer was bluffing, computer takes the pile
+        - If computer was honest, player takes the pile
+        
+        Returns boolean:
+        True if the turn is over (call resolved or time ran out), False if nothing was called
+        """
+        # No more moves once someone ran out of time, and none while another
+        # move is still being resolved (a message can process a second click)
+        if self.flagged is not None or self.in_move:
+            return False
+        # Validate there are cards to call bluff on
+        if len(self.pile) == 0:
+            self.notify("Error", "No cards in the pile to call bluff on!")
+            return False
+        # Only the computer's claim can be challenged, never the player's own
+        if self.plays[-1].actor != COMPUTER:
+            self.notify("Error", "The last play was yours, wait for the computer's claim!")
+            return False
+        # Stop the player's clock, the call is lost if it came too late
+        if not self.end_move(PLAYER):
+            return True
+            
+        # Keep check_game_over quiet until the whole move is resolved
+        self.in_move = True
+        try:
+            # Get the last play, which holds exactly the cards of the computer's last claim
+            last_play = self.plays[-1]
+            # Check if any of the last played cards don't match the claimed rank
+            bluff_caught = not last_play.is_honest(self.pile)
+            # Build the list of revealed cards for the messages below
+            revealed = " ".join(card.get_symbol() for card in last_play.cards(self.pile))
+            # Record the challenge on the computer's last claim
+            if self.move_log:
+                self.move_log[-1]["challenged"] = True
+                self.move_log[-1]["challenge_result"] = int(bluff_caught)
+            # Record the call and who takes the pile
+            self.record_call(PLAYER, COMPUTER if bluff_caught else PLAYER)
+            if bluff_caught:
+                # Computer was caught bluffing
+                self.notify(
+                    "Caught!",
+                    f"You caught the computer bluffing ({revealed})! Computer takes the pile..."
+                )
+                # Computer must take all cards in the pile
+                self.computer_hand.extend(self.pile)
+            else:
+                # Computer was playing honestly
+                self.notify(
+                    "Wrong!",
+                    f"Computer was honest ({revealed})! You take the pile..."
+                )
+                # Player must take all cards in the pile
+                self.player_hand.extend(self.pile)
+            
+            # Clear the pile after cards are taken
+            self.clear_pile()
+            # Advance to next rank after pile is taken
+            self.next_rank()
+            # The player moves again after calling
+            self.start_move(PLAYER)
+            return True
+        finally:
+            self.in_move = False
+
+    def push_play(self, actor, cards_played, hand):
+        """Move cards from a hand to the pile and push them as one play
+        
+        actor: PLAYER or COMPUTER
+        cards_played: Cards being claimed as the current rank
+        hand: The actor's hand the cards are taken from
+        """
+        # Record the play in the history before the cards move
+        self.history.push(pack_play(actor, RANKS.index(self.current_rank), cards_played),
+                          self.packed_state)
+        # The new play starts where the pile currently ends
+        start = len(self.pile)
+        for card in cards_played:
+            hand.remove(card)       # Remove card from the hand
+            self.pile.append(card)  # Add card to the play pile
+        # Remember the claim and the pile slice holding its cards
+        self.plays.append(Play(actor, self.current_rank, start, len(self.pile)))
+
+    def record_call(self, caller, taker):
+        """Record a called bluff in the history before the pile is taken
+        
+        caller: PLAYER or COMPUTER, who called bluff
+        taker: PLAYER or COMPUTER, who takes the pile
+        """
+        self.history.push(pack_call(caller, RANKS.index(self.current_rank), taker),
+                          self.packed_state)
+
+    def packed_state(self):
+        """Pack the current position for a history checkpoint"""
+        return pack_state(self.player_hand, self.computer_hand, self.pile, self.current_rank)
+
+    def clear_pile(self):
+        """Empty the pile and its play stack after a player takes the cards"""
+        self.pile = []
+        self.plays = []
+
+    def record_move(self, actor, cards_played):
+        """Append the features of a claim to the move log
+        
+        actor: PLAYER or COMPUTER
+        cards_played: Cards that were just moved from the actor's hand to the pile
+        
+        Returns the new record so a challenge can be added to it afterwards
+        """
+        claim_size = len(cards_played)
+        record = {
+            "actor": actor,
+            "claimed_rank": RANKS.index(self.current_rank),
+            "claim_size": claim_size,
+            # Honest only if every played card matches the announced rank
+            "honest": all(card.rank == self.current_rank for card in cards_played),
+            # Sizes as they were before the cards were played
+            "pile_size": len(self.pile) - claim_size,
+            "player_hand": len(self.player_hand) + (claim_size if actor == PLAYER else 0),
+            "computer_hand": len(self.computer_hand) + (claim_size if actor == COMPUTER else 0),
+            # Filled in when the opponent calls bluff on this claim
+            "challenged": False,
+            "challenge_result": -1,
+        }
+        self.move_log.append(record)
+        return record
+
+    def save_move_log(self):
+        """Append this game's move records to the log file as one JSON line"""
+        with open(self.log_path, "a", encoding="utf-8") as log_file:
+            log_file.write(format_game_record(self.move_log))
+        # Remember the game is saved so repeated checks don't log it twice
+        self.game_logged = True
+
+    def next_rank(self):
+        """Advance to the next rank in the sequence
+        
+        Moves to the next rank in order (2->3->4->...->K->A->2)
+        Uses modulo to wrap around to beginning when reaching the end
+        """
+        # Find the current rank's position in the ranks list
+        current_index = RANKS.index(self.current_rank)
+        # Set current_rank to next rank, wrapping around to start if at end
+        self.current_rank = RANKS[(current_index + 1) % len(RANKS)]
+
+    def check_game_over(self):
+        """Check if either player has won the game
+        
+        Win condition: A player wins when they have no cards left,
+        or when the opponent runs out of time
+        Saves the game's move records once if a log file was given
+        
+        Returns PLAYER or COMPUTER for the winner, None while the game goes on
+        """
+        # A notify callback can run GUI timers in the middle of a move, when a
+        # hand may be empty just before it picks up the pile
+        if self.in_move:
+            return None
+        # Player wins if they have no cards
+        if len(self.player_hand) == 0:
+            winner = PLAYER
+        # Computer wins if it has no cards
+        elif len(self.computer_hand) == 0:
+            winner = COMPUTER
+        else:
+            # Flag the player whose running clock reached zero, even without a move
+            if self.clock and self.clock.running is not None and self.clock.is_flagged(self.clock.running):
+                self.end_move(self.clock.running)
+            if self.flagged is None:
+                return None
+            # The opponent of a player out of time wins
+            winner = COMPUTER if self.flagged == PLAYER else PLAYER
+        # Stop the clocks once the game is decided
+        if self.clock:
+            self.clock.stop()
+        # Log the finished game once for the analytics pipeline
+        if self.log_path and not self.game_logged:
+            self.save_move_log()
+        return winner
@@ -0,0 +1,668 @@
+"""Tkinter window of the bluff card game
+
+The only module that imports tkinter. Headless code (engine, analytics,
+rendering math, simulation) lives in the rest of the package and never
+loads this one.
+"""
+
+# Import the main tkinter library for creating the graphical user interface (GUI)
+import tkinter as tk
+# Import themed widgets from tkinter for better-looking buttons
+from tkinter import ttk
+
+from .cards import RANKS
+from .clock import GameClock
+from .engine import BluffGame, PLAYER, COMPUTER
+from .render import ROW_SPACING, TkCanvasBackend, build_hand_tiles, draw_hand
+
+# Define a custom message box class that inherits from tkinter's Toplevel window
+class CustomMessageBox(tk.Toplevel):
+    # Initialize the message box with parent window, title, message and type
+    def __init__(self, parent, title, message, message_type="info"):
+        # Call the parent class's initializer
+        super().__init__(parent)
+        
+        # Set the window title
+        self.title(title)
+        # Set the window size to 400x200 pixels
+        self.geometry("400x200")
+        # Disable window resizing in both directions
+        self.resizable(False, False)
+        
+        # Define color scheme for different message types using hex color codes
+        colors = {
+            "info": "#2196F3",    # Blue color for information messages
+            "warning": "#FFA726",  # Orange color for warning messages
+            "error": "#EF5350",    # Red color for error messages
+            "success": "#66BB6A"   # Green color for success messages
+        }
+        
+        # Set the window background to white
+        self.configure(bg="white")
+        # Get the color based on message type, default to info color if type not found
+        self.color = colors.get(message_type, colors["info"])
+        
+        # Create and set up all the widgets in the message box
+        self.create_widgets(message)
+        
+        # Make the window modal (blocks interaction with parent window)
+        self.transient(parent)
+        # Grab all events (force focus on this window)
+        self.grab_set()
+        
+        # Center the window on the screen
+        self.center_window()
+
+    def create_widgets(self, message):
+        # Create a colored header frame at the top of the message box
+        header = tk.Frame(self, height=30, bg=self.color)
+        # Pack the header frame to fill horizontally with padding below
+        header.pack(fill="x", pady=(0, 20))
+        
+        # Create a frame to contain the message text with white background
+        msg_frame = tk.Frame(self, bg="white")
+        # Pack the message frame to expand and fill available space with padding
+        msg_frame.pack(expand=True, fill="both", padx=20, pady=(0, 20))
+        
+        # Create a label to display the message text
+        msg_label = tk.Label(
+            msg_frame,            # Place label in the message frame
+            text=message,         # Set the message text
+            font=("Arial", 12),   # Use Arial font, size 12
+            wraplength=350,       # Wrap text if it exceeds 350 pixels
+            bg="white"           # White background to match frame
+        )
+        # Pack the message label to expand and center in its frame
+        msg_label.pack(expand=True)
+        
+        # Create a frame for the OK button with white background
+        btn_frame = tk.Frame(self, bg="white")
+        # Pack the button frame to fill horizontally with padding
+        btn_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        # Create a style configuration for the button
+        style = ttk.Style()
+        # Configure custom button style with padding and font
+        style.configure("Custom.TButton", 
+                       padding=10,           # Add padding around button text
+                       font=("Arial", 10))   # Set button font and size
+        
+        # Create the OK button with custom style
+        ok_btn = ttk.Button(
+            btn_frame,              # Place button in button frame
+            text="OK",             # Set button text
+            style="Custom.TButton", # Apply custom style
+            command=self.destroy    # Close window when clicked
+        )
+        # Pack the button to the right side of its frame
+        ok_btn.pack(side="right")
+
+    def center_window(self):
+        # Update window's geometry information
+        self.update_idletasks()
+        
+        # Get the screen's width and height
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        
+        # Calculate the x and y coordinates for the window to be centered
+        x = (screen_width - self.winfo_width()) // 2    # Center horizontally
+        y = (screen_height - self.winfo_height()) // 2  # Center vertically
+        
+        # Set the window position using geometry string
+        self.geometry(f"+{x}+{y}")  # + prefix sets position instead of size
+
+class BluffGameGUI:
+    # Initialize the main game window and set up the game
+    def __init__(self, root, log_path=None, clock_seconds=None, increment=0, bot_deadline=None):
+        # Store the root window reference
+        self.root = root
+        # Store the file finished games are appended to (None disables logging)
+        self.log_path = log_path
+        # Store each player's time bank in seconds (None for untimed games)
+        self.clock_seconds = clock_seconds
+        # Store the seconds added to a time bank after every move
+        self.increment = increment
+        # Store the seconds the computer may spend on one decision (None for no limit)
+        self.bot_deadline = bot_deadline
+        # Set the window title
+        self.root.title("Bluff Card Game")
+        # Set the initial window size
+        self.root.geometry("1024x768")
+        # Set the background color to dark green
+        self.root.configure(bg="#1e4d2b")
+        
+        # Hands larger than this are shown as one tile per rank with a count badge
+        self.compact_threshold = 40
+        
+        # Initialize the game state (deck, hands, etc.)
+        self.setup_game()
+        # Create and set up the graphical user interface
+        self.create_gui()
+        
+        # Wait for window to be rendered before updating display
+        self.root.update()
+        # Draw the initial game state
+        self.update_display()
+        
+        # Bind the window resize event to update the display
+        self.root.bind("<Configure>", lambda e: self.update_display())
+        
+        # Start refreshing the remaining time of timed games
+        if self.game.clock:
+            self.update_clock()
+
+    def setup_game(self):
+        # Give both players a fresh time bank if the game is timed
+        clock = GameClock(self.clock_seconds, self.increment) if self.clock_seconds else None
+        # Deal a new game whose messages appear in the message label
+        self.game = BluffGame(notify=self.show_message, log_path=self.log_path,
+                              clock=clock, bot_deadline=self.bot_deadline)
+        # Set to track which cards player has selected
+        self.selected_cards = set()
+        # Whether the GameOverScreen was already shown
+        self.game_over = False
+
+    def create_gui(self):
+        # Create main information frame at top of window
+        self.info_frame = tk.Frame(self.root, bg="#1e4d2b")  # Dark green background
+        # Pack frame to fill horizontally with padding
+        self.info_frame.pack(fill='x', pady=10, padx=20)
+        
+        # Create left section of info frame for current rank display
+        self.info_left = tk.Frame(self.info_frame, bg="#1e4d2b")
+        # Pack frame to left side
+        self.info_left.pack(side="left")
+        
+        # Create label showing current rank in play
+        self.current_rank_label = tk.Label(
+            self.info_left,           # Place in left info frame
+            text="Current Rank: 2",    # Initial text showing rank 2
+            font=("Arial Bold", 16),   # Bold Arial font, size 16
+            bg="#1e4d2b",             # Dark green background
+            fg="white"                # White text color
+        )
+        # Pack the rank label
+        self.current_rank_label.pack()
+        
+        # Create counter showing number of computer's cards (top right)
+        self.computer_counter = tk.Label(
+            self.info_frame,                  # Place in info frame
+            text="Computer's Cards: 26",      # Initial text showing 26 cards
+            font=("Arial Bold", 16),          # Bold Arial font, size 16
+            bg="#1e4d2b",                    # Dark green background
+            fg="white"                       # White text color
+        )
+        # Pack counter to right side
+        self.computer_counter.pack(side="right")
+        
+        # Create label showing both players' remaining time (empty for untimed games)
+        self.clock_label = tk.Label(
+            self.info_frame,                  # Place in info frame
+            text="",                          # Filled in by update_clock
+            font=("Arial Bold", 16),          # Bold Arial font, size 16
+            bg="#1e4d2b",                    # Dark green background
+            fg="white"                       # White text color
+        )
+        # Pack label in the middle between rank and computer counter
+        self.clock_label.pack(expand=True)
+        
+        # Create message label for displaying game notifications (e.g., "Computer calls bluff!")
+        self.message_label = tk.Label(
+            self.root,                # Place in main window
+            text="",                  # Initially empty
+            font=("Arial Bold", 16),  # Bold Arial font, size 16
+            bg="#1e4d2b",            # Dark green background to match window
+            fg="#ff4444",            # Red text color for visibility
+            wraplength=800           # Wrap text if longer than 800 pixels
+        )
+        # Pack message label with vertical padding
+        self.message_label.pack(pady=(0, 20))
+        
+        # Create frame for scrollable card display area
+        self.scroll_frame = tk.Frame(self.root, bg="#1e4d2b")
+        # Pack frame to expand and fill available space with horizontal padding
+        self.scroll_frame.pack(expand=True, fill="both", padx=20)
+        
+        # Create vertical scrollbar for hands with more rows than fit on screen
+        self.cards_scrollbar = tk.Scrollbar(
+            self.scroll_frame,        # Place in scroll frame
+            orient="vertical",        # Scroll up and down
+            command=self.on_scroll    # Redraw the visible rows when scrolled
+        )
+        # Pack scrollbar along the right edge of the card area
+        self.cards_scrollbar.pack(side="right", fill="y")
+        
+        # Create canvas for drawing cards
+        self.cards_canvas = tk.Canvas(
+            self.scroll_frame,        # Place in scroll frame
+            bg="#1e4d2b",            # Dark green background
+            height=430,              # Initial height for card display
+            highlightthickness=0,    # Remove canvas border
+            yscrollcommand=self.cards_scrollbar.set,  # Keep scrollbar in sync
+            yscrollincrement=ROW_SPACING  # Scroll one row of cards per step
+        )
+        # Pack canvas to expand and fill available space
+        self.cards_canvas.pack(expand=True, fill="both")
+        # Draw the hand through the Tk rendering backend
+        self.hand_backend = TkCanvasBackend(self.cards_canvas)
+        
+        # Configure style for game buttons
+        style = ttk.Style()
+        # Set custom button style with dark red theme
+        style.configure("Game.TButton",
+                       padding=10,                # Add padding around button text
+                       font=("Arial Bold", 12),   # Bold Arial font, size 12
+                       background="#8B0000",      # Dark red background
+                       foreground="white")        # White text
+        
+        # Create black separator line between cards and menu bar
+        separator = tk.Frame(self.root, height=2, bg="black")
+        # Pack separator at bottom of window
+        separator.pack(side="bottom", fill="x")
+        
+        # Create bottom menu bar with dark red background
+        self.menu_bar = tk.Frame(self.root, bg="#8B0000", height=150)
+        # Pack menu bar at bottom with fixed height
+        self.menu_bar.pack(side="bottom", fill="x")
+        # Prevent menu bar from resizing
+        self.menu_bar.pack_propagate(False)
+        
+        # Create frame for selected cards counter on the left side
+        self.counter_frame = tk.Frame(self.menu_bar, bg="#8B0000")  # Dark red background
+        # Pack frame to left side with padding
+        self.counter_frame.pack(side="left", padx=30)
+        
+        # Create label to show number of currently selected cards
+        self.selected_count_label = tk.Label(
+            self.counter_frame,        # Place in counter frame
+            text="Selected: 0",        # Initial text showing no cards selected
+            font=("Arial Bold", 16),   # Bold Arial font, size 16
+            bg="#8B0000",             # Dark red background
+            fg="white"                # White text color
+        )
+        # Pack the selected count label
+        self.selected_count_label.pack()
+        
+        # Create frame for player's cards counter on the right side
+        self.your_cards_frame = tk.Frame(self.menu_bar, bg="#8B0000")
+        # Pack frame to right side with padding
+        self.your_cards_frame.pack(side="right", padx=30)
+        
+        # Create label to show number of cards in player's hand
+        self.your_cards_label = tk.Label(
+            self.your_cards_frame,     # Place in cards frame
+            text="Your Cards: 26",     # Initial text showing 26 cards
+            font=("Arial Bold", 16),   # Bold Arial font, size 16
+            bg="#8B0000",             # Dark red background
+            fg="white"                # White text color
+        )
+        # Pack the cards count label
+        self.your_cards_label.pack()
+        
+        # Create center frame for main game buttons
+        self.button_frame = tk.Frame(self.menu_bar, bg="#8B0000")
+        # Pack frame to expand and fill remaining space
+        self.button_frame.pack(expand=True, fill="both")
+        
+        # Create container to center buttons vertically
+        button_container = tk.Frame(self.button_frame, bg="#8B0000", height=150)
+        # Pack container to fill space
+        button_container.pack(expand=True, fill="both")
+        # Prevent container from shrinking to fit content
+        button_container.pack_propagate(False)
+        
+        # Create inner frame for precise button positioning
+        inner_button_frame = tk.Frame(button_container, bg="#8B0000")
+        # Place frame exactly in center of container
+        inner_button_frame.place(relx=0.5, rely=0.5, anchor="center")
+        
+        # Create main "Play Cards" button with custom styling
+        self.play_button = tk.Button(
+            inner_button_frame,          # Place in centered inner frame
+            text="Play Cards",           # Button text
+            font=("Arial Bold", 20),     # Large bold font for visibility
+            bg="white",                  # White background
+            fg="black",                  # Black text
+            activebackground="#e0e0e0",  # Slightly darker when clicked
+            activeforeground="black",    # Text stays black when clicked
+            relief="raised",             # 3D effect for button
+            borderwidth=3,               # Thick border for better visibility
+            padx=50,                     # Horizontal internal padding
+            pady=20,                     # Vertical internal padding
+            command=self.play_cards      # Function to call when clicked
+        )
+        # Pack play button to the left with spacing
+        self.play_button.pack(side=tk.LEFT, padx=50)
+        
+        # Create "Call Bluff" button with matching styling
+        self.call_bluff_button = tk.Button(
+            inner_button_frame,          # Place in centered inner frame
+            text="Call Bluff",           # Button text
+            font=("Arial Bold", 20),     # Large bold font
+            bg="white",                  # White background
+            fg="black",                  # Black text
+            activebackground="#e0e0e0",  # Slightly darker when clicked
+            activeforeground="black",    # Text stays black when clicked
+            relief="raised",             # 3D effect
+            borderwidth=3,               # Thick border
+            padx=50,                     # Horizontal padding
+            pady=20,                     # Vertical padding
+            command=self.call_bluff      # Function to call when clicked
+        )
+        # Pack bluff button to the left of play button with spacing
+        self.call_bluff_button.pack(side=tk.LEFT, padx=50)
+        
+        # Add hover effects to both game buttons
+        for button in (self.play_button, self.call_bluff_button):
+            # Bind mouse enter event to change background color
+            button.bind("<Enter>", 
+                       lambda e, b=button: b.configure(bg="#e0e0e0"))  # Darken when hovered
+            # Bind mouse leave event to restore original color
+            button.bind("<Leave>", 
+                       lambda e, b=button: b.configure(bg="white"))    # Return to white when mouse leaves
+        
+        # Bind left mouse click on canvas to handle card selection
+        self.cards_canvas.bind("<Button-1>", self.on_card_click)
+        # Bind mouse wheel to scroll the cards (Button-4/5 are used on Linux)
+        self.cards_canvas.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.cards_canvas.bind("<Button-4>", self.on_mouse_wheel)
+        self.cards_canvas.bind("<Button-5>", self.on_mouse_wheel)
+
+    def show_message(self, title, message, message_type="info"):
+        """Display a temporary message in the game interface
+        
+        message: The message to display
+        """
+        # Update the message label with new text
+        self.message_label.config(text=message)
+        # Force update to show message immediately
+        self.root.update()
+        # Schedule message removal after 3 seconds (3000 milliseconds)
+        self.root.after(3000, lambda: self.message_label.config(text=""))
+
+    def update_display(self):
+        # Update all counter labels with current game state
+        self.your_cards_label.config(text=f"Your Cards: {len(self.game.player_hand)}")
+        self.computer_counter.config(text=f"Computer's Cards: {len(self.game.computer_hand)}")
+        self.current_rank_label.config(text=f"Current Rank: {self.game.current_rank}")
+        
+        # Get the tiles to draw (one per card, or one per rank for large hands)
+        self.drawn_tiles = build_hand_tiles(
+            self.game.player_hand, self.selected_cards, RANKS, self.compact_threshold)
+        # Draw the visible rows and keep the layout for mapping clicks
+        self.hand_layout = draw_hand(self.hand_backend, self.drawn_tiles)
+
+    def on_scroll(self, *args):
+        """Scroll the card area and draw the rows that came into view
+        
+        args: Scrollbar command arguments, passed on to the canvas
+        """
+        self.cards_canvas.yview(*args)
+        self.update_display()
+
+    def on_mouse_wheel(self, event):
+        """Scroll the card area one row per mouse wheel step
+        
+        event: Wheel event (delta on Windows/macOS, Button-4/5 on Linux)
+        """
+        # Wheel up scrolls towards the first row
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self.on_scroll("scroll", direction, "units")
+
+    def on_card_click(self, event):
+        """Handle mouse clicks on cards in the play area
+        
+        event: The mouse click event containing x,y coordinates
+        """
+        # Convert window coordinates to canvas coordinates to account for scrolling
+        canvas_x = self.cards_canvas.canvasx(event.x)
+        canvas_y = self.cards_canvas.canvasy(event.y)
+        
+        # Map the click to a tile using the layout of the last redraw
+        tile_index = self.hand_layout.tile_at(canvas_x, canvas_y)
+        if tile_index is None:
+            return  # Clicked between or outside the cards
+        self.toggle_tile(self.drawn_tiles[tile_index][4])
+        
+        # Update the selected count label
+        self.selected_count_label.config(text=f"Selected: {len(self.selected_cards)}")
+        # Redraw the cards to show updated selection state
+        self.update_display()
+
+    def toggle_tile(self, tag):
+        """Update the selection for a clicked tile
+        
+        tag: 'card_X' for a single card or 'rank_X' for a grouped rank
+        """
+        # Check if the tile is a card (has 'card_X' tag)
+        if tag.startswith("card_"):
+            # Extract card index from tag
+            card_index = int(tag.split("_")[1])
+            
+            # Toggle card selection
+            if card_index in self.selected_cards:
+                self.selected_cards.remove(card_index)  # Deselect if already selected
+            else:
+                self.selected_cards.add(card_index)     # Select if not selected
+        # Otherwise the tile is a grouped rank (has 'rank_X' tag)
+        else:
+            rank = tag.split("_")[1]
+            # Find every card of this rank in the hand
+            indices = [i for i, card in enumerate(self.game.player_hand) if card.rank == rank]
+            unselected = [i for i in indices if i not in self.selected_cards]
+            
+            # Select one more card of the rank, or clear the rank once all are selected
+            if unselected:
+                self.selected_cards.add(unselected[0])
+            else:
+                self.selected_cards.difference_update(indices)
+
+    def play_cards(self):
+        """Handle the Play Cards button
+        
+        Plays the selected cards through the game, which also lets the
+        computer respond and take its turn, then refreshes the window.
+        """
+        # Take the selection and clear it before the game shows any message,
+        # so a click handled during the move finds nothing selected
+        cards_to_play = set(self.selected_cards)
+        self.selected_cards.clear()
+        self.selected_count_label.config(text="Selected: 0")
+        
+        # Let the game validate and resolve the play
+        if not self.game.play_cards(cards_to_play):
+            return
+        
+        # Update the display to reflect all changes
+        self.update_display()
+        # Check if game is over after play
+        self.check_game_over()
+
+    def call_bluff(self):
+        """Handle the Call Bluff button
+        
+        Challenges the computer's last claim through the game, then
+        refreshes the window.
+        """
+        # Let the game validate and resolve the call
+        if not self.game.call_bluff():
+            return
+        
+        # The hand may have grown, so old selection indices are stale
+        self.selected_cards.clear()
+        self.selected_count_label.config(text="Selected: 0")
+        # Update display to show new game state
+        self.update_display()
+        # Check if game is over after play
+        self.check_game_over()
+
+    def update_clock(self):
+        """Show both players' remaining time and flag a player whose time is up
+        
+        Reschedules itself every 200 milliseconds until the game is over
+        """
+        clock = self.game.clock
+        # Format seconds as minutes:seconds
+        player_time = int(clock.time_left(PLAYER))
+        computer_time = int(clock.time_left(COMPUTER))
+        self.clock_label.config(
+            text=f"Your Time: {player_time // 60}:{player_time % 60:02d}   "
+                 f"Computer: {computer_time // 60}:{computer_time % 60:02d}")
+        # A player can run out of time while thinking, without pressing a button
+        self.check_game_over()
+        if not self.game_over:
+            self.root.after(200, self.update_clock)
+
+    def check_game_over(self):
+        """Show the GameOverScreen once either player has won"""
+        if self.game_over:
+            return
+        winner = self.game.check_game_over()
+        if winner is None:
+            return
+        self.game_over = True
+        # Options for the next game started from the GameOverScreen
+        game_options = {
+            "log_path": self.log_path,
+            "clock_seconds": self.clock_seconds,
+            "increment": self.increment,
+            "bot_deadline": self.bot_deadline,
+        }
+        # Player wins if they have no cards or the computer ran out of time
+        if winner == PLAYER:
+            GameOverScreen(self.root, "Congratulations! You win!", game_options)
+        # Computer wins if it has no cards or the player ran out of time
+        elif self.game.flagged == PLAYER:
+            GameOverScreen(self.root, "You ran out of time! Computer wins!", game_options)
+        else:
+            GameOverScreen(self.root, "Computer wins! Better luck next time!", game_options)
+
+class GameOverScreen(tk.Toplevel):
+    """Modal window displayed when game ends
+    
+    Shows game result and provides options to:
+    1. Play again (starts new game)
+    2. Quit (closes application)
+    """
+    def __init__(self, parent, message, game_options=None):
+        # Initialize parent class (Toplevel window)
+        super().__init__(parent)
+        # Keep the BluffGameGUI options (log file, clock) for the next game
+        self.game_options = game_options or {}
+        
+        # Configure window properties
+        self.title("Game Over")           # Set window title
+        self.geometry("400x300")          # Set window size
+        self.resizable(False, False)      # Prevent window resizing
+        self.configure(bg="#1e4d2b")      # Set dark green background
+        
+        # Make window modal (blocks interaction with main window)
+        self.transient(parent)
+        self.grab_set()
+        
+        # Create "GAME OVER" header label
+        tk.Label(
+            self,                         # Place in this window
+            text="GAME OVER",             # Header text
+            font=("Arial Bold", 24),      # Large bold font
+            bg="#1e4d2b",                # Match window background
+            fg="white"                    # White text color
+        ).pack(pady=20)
+        
+        # Create result message label
+        tk.Label(
+            self,
+            text=message,                 # Win/lose message
+            font=("Arial", 16),           # Medium size font
+            bg="#1e4d2b",                # Match window background
+            fg="white",                   # White text color
+            wraplength=350               # Wrap text if too long
+        ).pack(pady=20)
+        
+        # Create "Play Again" button
+        tk.Button(
+            self,
+            text="Play Again",            # Button text
+            font=("Arial Bold", 14),      # Bold font
+            bg="white",                   # White background
+            fg="black",                   # Black text
+            command=self.play_again,      # Method to call when clicked
+            padx=20,                      # Horizontal padding
+            pady=10                       # Vertical padding
+        ).pack(pady=20)
+        
+        # Create "Quit" button
+        tk.Button(
+            self,
+            text="Quit",                  # Button text
+            font=("Arial Bold", 14),      # Bold font
+            bg="#8B0000",                # Dark red background
+            fg="white",                   # White text
+            command=self.quit_game,       # Method to call when clicked
+            padx=20,                      # Horizontal padding
+            pady=10                       # Vertical padding
+        ).pack(pady=10)
+        
+        # Center window on screen
+        self.center_window()
+    
+    def center_window(self):
+        """Center the game over window on the screen
+        
+        Calculates the position to place window in center of screen
+        based on screen dimensions and window size
+        """
+        # Update window's geometry information before calculating position
+        self.update_idletasks()
+        
+        # Get the screen dimensions
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        
+        # Calculate center position
+        x = (screen_width - self.winfo_width()) // 2   # Center horizontally
+        y = (screen_height - self.winfo_height()) // 2  # Center vertically
+        
+        # Set window position using geometry string
+        self.geometry(f"+{x}+{y}")  # + prefix sets position instead of size
+    
+    def play_again(self):
+        """Handle the Play Again button click
+        
+        Closes current game and starts a new game instance:
+        1. Quits current game
+        2. Creates new game instance
+        3. Closes game over screen
+        """
+        # Quit the current game instance
+        self.master.quit()
+        # Create a new game instance with same root window
+        game = BluffGameGUI(self.master, **self.game_options)
+        # Close the game over screen
+        self.destroy()
+    
+    def quit_game(self):
+        """Handle the Quit button click
+        
+        Exits the game completely by closing the main window
+        """
+        # Quit the entire application
+        self.master.quit()
+
+# Program entry point
+def main(log_path=None, clock_seconds=None, increment=0, bot_deadline=None):
+    """Open the game window and run the Tk event loop until it is closed
+    
+    log_path: File finished games are appended to (None disables logging)
+    clock_seconds: Each player's time bank (None for untimed games)
+    increment: Seconds added to a time bank after every move
+    bot_deadline: Seconds the computer may spend on one decision
+    """
+    # Create the main application window
+    root = tk.Tk()
+    # Create the game instance
+    game = BluffGameGUI(root, log_path, clock_seconds, increment, bot_deadline)
+    # Start the main event loop
+    # This blocks until the window is closed
+    root.mainloop()
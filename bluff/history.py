@@ -0,0 +1,160 @@
+"""Memory-bounded move history with periodic checkpoints
+
+Every move is packed into one 64-bit integer and stored in a fixed-size
+ring buffer. Every checkpoint_interval moves, the state before the move
+is saved as rank-count arrays. Any position whose checkpoint and later
+moves are still in the buffer can be rebuilt by replaying from the
+nearest checkpoint; older positions are forgotten.
+
+Memory per table is fixed by the two settings: 8 bytes per buffered
+move plus 40 bytes (and the usual tuple overhead, about 100 bytes) per
+checkpoint, with at most capacity // checkpoint_interval + 1
+checkpoints. The defaults (1024 moves, a checkpoint every 64) come to
+8 KiB for the buffer and under 3 KiB for the 17 checkpoints.
+
+The endgame solver keeps nothing between moves; while the computer is
+deciding it may hold up to about 2.6 MB (see bluff.endgame).
+
+Record layout (bit 0 is the lowest):
+    bit 0      kind: 0 for a play, 1 for a called bluff
+    bit 1      actor: who played, or who called
+    bits 2-5   rank index claimed (play) or being played when called (call)
+    bit 6      call only: who took the pile
+    bits 8-46  play only: 13 three-bit counts of the played cards by rank
+"""
+
+# Import array for the fixed-size buffer of packed records
+from array import array
+# Import deque for the checkpoints, dropped from the old end
+from collections import deque
+
+from .cards import RANKS
+
+PLAY = 0  # Record kind of cards played to the pile
+CALL = 1  # Record kind of a bluff being called
+
+def rank_counts(cards):
+    """Count cards by rank
+    
+    Returns list of 13 counts, indexed like RANKS
+    """
+    counts = [0] * len(RANKS)
+    for card in cards:
+        counts[RANKS.index(card.rank)] += 1
+    return counts
+
+def pack_state(player_hand, computer_hand, pile, current_rank):
+    """Pack a game position into 40 bytes: three rank-count arrays and the rank index"""
+    return bytes(rank_counts(player_hand) + rank_counts(computer_hand) + rank_counts(pile)
+                 + [RANKS.index(current_rank)])
+
+def unpack_state(packed):
+    """Unpack a position from pack_state
+    
+    Returns (player_counts, computer_counts, pile_counts, rank_index)
+    """
+    return list(packed[0:13]), list(packed[13:26]), list(packed[26:39]), packed[39]
+
+def pack_play(actor, rank_index, cards):
+    """Pack cards played by actor and claimed as RANKS[rank_index]"""
+    record = PLAY | actor << 1 | rank_index << 2
+    for index, count in enumerate(rank_counts(cards)):
+        record |= count << (8 + 3 * index)
+    return record
+
+def pack_call(caller, rank_index, taker):
+    """Pack a bluff called by caller, after which taker took the pile"""
+    return CALL | caller << 1 | rank_index << 2 | taker << 6
+
+def unpack_record(record):
+    """Unpack a record from pack_play or pack_call
+    
+    Returns (PLAY, actor, rank_index, counts) or (CALL, caller, rank_index, taker)
+    """
+    kind = record & 1
+    actor = record >> 1 & 1
+    rank_index = record >> 2 & 0xF
+    if kind == CALL:
+        return CALL, actor, rank_index, record >> 6 & 1
+    return PLAY, actor, rank_index, [record >> (8 + 3 * index) & 0x7 for index in range(len(RANKS))]
+
+class MoveHistory:
+    # Create an empty history keeping the last capacity moves
+    def __init__(self, capacity=1024, checkpoint_interval=64):
+        if checkpoint_interval > capacity:
+            raise ValueError("checkpoint_interval must not be larger than capacity")
+        # Store the number of moves kept in the buffer
+        self.capacity = capacity
+        # Store the number of moves between two checkpoints
+        self.checkpoint_interval = checkpoint_interval
+        # Ring buffer of packed records; move n lives at index n % capacity
+        self.records = array("Q", bytes(8 * capacity))
+        # Number of moves pushed since the start of the game
+        self.total = 0
+        # (move number, packed state before that move), oldest first
+        self.checkpoints = deque()
+    
+    # Number of moves made in the game, including forgotten ones
+    def __len__(self):
+        return self.total
+    
+    # Number of the oldest move still in the buffer
+    def oldest(self):
+        return max(0, self.total - self.capacity)
+    
+    def push(self, record, snapshot):
+        """Add a packed record
+        
+        record: Result of pack_play or pack_call
+        snapshot: Function returning pack_state of the position before this move,
+                  only called when a checkpoint is due
+        """
+        if self.total % self.checkpoint_interval == 0:
+            self.checkpoints.append((self.total, snapshot()))
+        self.records[self.total % self.capacity] = record
+        self.total += 1
+        # Drop checkpoints whose following moves are no longer all in the buffer
+        while self.checkpoints[0][0] < self.oldest():
+            self.checkpoints.popleft()
+    
+    def moves(self, start, stop=None):
+        """Yield unpacked records of moves start .. stop - 1 (default: up to the latest)"""
+        if stop is None:
+            stop = self.total
+        if start < self.oldest() or stop > self.total:
+            raise ValueError(f"moves {start}..{stop} are not in the history")
+        for number in range(start, stop):
+            yield unpack_record(self.records[number % self.capacity])
+    
+    def state_at(self, move):
+        """Rebuild the position before a move, replaying from the nearest checkpoint
+        
+        move: Move number, from the oldest kept checkpoint up to len(self)
+        
+        Returns (player_counts, computer_counts, pile_counts, rank_index)
+        """
+        # Find the latest checkpoint at or before the move
+        base = None
+        for checkpoint in self.checkpoints:
+            if checkpoint[0] > move:
+                break
+            base = checkpoint
+        if base is None or move > self.total:
+            raise ValueError(f"move {move} is not in the history")
+        
+        start, packed = base
+        player, computer, pile, rank_index = unpack_state(packed)
+        hands = (player, computer)
+        for kind, actor, record_rank, detail in self.moves(start, move):
+            if kind == PLAY:
+                # Move the played counts from the actor's hand to the pile
+                for index, count in enumerate(detail):
+                    hands[actor][index] -= count
+                    pile[index] += count
+            else:
+                # The taker picks up the pile and play moves to the next rank
+                for index, count in enumerate(pile):
+                    hands[detail][index] += count
+                    pile[index] = 0
+                rank_index = (record_rank + 1) % len(RANKS)
+        return player, computer, pile, rank_index
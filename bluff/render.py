@@ -0,0 +1,280 @@
+"""Rendering of the player's hand
+
+Layout math, tile building and drawing go through a small backend
+interface: TkCanvasBackend draws on the real canvas, RecordingBackend
+records draw commands in memory. Nothing here imports tkinter.
+"""
+
+# Import time for timing redraws in the render benchmark
+import time
+
+from .cards import RANKS, SUITS, Card
+
+# Fixed dimensions for card display, shared by the layout and the click mapping
+CARD_WIDTH = 80     # Width of each card in pixels
+CARD_HEIGHT = 120   # Height of each card in pixels
+CARD_SPACING = 10   # Horizontal space between cards
+ROW_SPACING = 140   # Vertical distance between the tops of two rows
+PADDING = 20        # Padding from canvas edges
+
+class HandLayout:
+    """Grid positions of the hand's tiles inside the visible part of the canvas
+    
+    Pure arithmetic with no drawing, so it can be checked without a display.
+    """
+    # Compute the grid for num_tiles tiles in a view of the given size scrolled to view_top
+    def __init__(self, num_tiles, view_width, view_height, view_top=0):
+        # Store the number of tiles laid out
+        self.num_tiles = num_tiles
+        # Ensure at least 1 card per row, otherwise calculate maximum that fit
+        self.cards_per_row = max(1, (view_width - PADDING) // (CARD_WIDTH + CARD_SPACING))
+        # Use integer division and round up to get number of rows
+        self.num_rows = (num_tiles + self.cards_per_row - 1) // self.cards_per_row
+        
+        # Calculate starting x position to center cards horizontally
+        # Use minimum of cards_per_row and actual number of cards to handle last row
+        total_width = min(self.cards_per_row, num_tiles) * (CARD_WIDTH + CARD_SPACING) - CARD_SPACING
+        self.x_start = (view_width - total_width) / 2
+        
+        # Total height needed by all rows
+        total_height = self.num_rows * ROW_SPACING - (ROW_SPACING - CARD_HEIGHT)
+        if total_height <= view_height:
+            # Center cards vertically when they all fit
+            self.y_start = (view_height - total_height) / 2
+            self.scroll_height = view_height
+        else:
+            # Otherwise start at the top and let the canvas scroll
+            self.y_start = PADDING
+            self.scroll_height = total_height + 2 * PADDING
+        
+        # Store the view height for picking the visible rows
+        self.view_height = view_height
+        self.set_view_top(view_top)
+    
+    # Pick the tiles inside the visible area for a view scrolled to view_top
+    def set_view_top(self, view_top):
+        # Only the rows inside the visible area get drawn
+        first_row = max(0, int((view_top - self.y_start) // ROW_SPACING))
+        last_row = min(self.num_rows - 1, int((view_top + self.view_height - self.y_start) // ROW_SPACING))
+        self.first_tile = first_row * self.cards_per_row
+        self.last_tile = min(self.num_tiles, (last_row + 1) * self.cards_per_row)
+    
+    # Get the top-left corner of tile i in canvas coordinates
+    def tile_position(self, i):
+        row = i // self.cards_per_row  # Integer division for row number
+        col = i % self.cards_per_row   # Remainder for column position
+        return (self.x_start + col * (CARD_WIDTH + CARD_SPACING),
+                self.y_start + row * ROW_SPACING)
+    
+    # Get the index of the tile under canvas point (x, y), or None for empty space
+    def tile_at(self, x, y):
+        col = int((x - self.x_start) // (CARD_WIDTH + CARD_SPACING))
+        row = int((y - self.y_start) // ROW_SPACING)
+        # Reject points left/right of the grid or above/below the rows
+        if col < 0 or col >= self.cards_per_row or row < 0:
+            return None
+        i = row * self.cards_per_row + col
+        if i >= self.num_tiles:
+            return None
+        # Reject points in the gaps between cards
+        tile_x, tile_y = self.tile_position(i)
+        if x > tile_x + CARD_WIDTH or y > tile_y + CARD_HEIGHT:
+            return None
+        return i
+
+def build_hand_tiles(hand, selected_cards, ranks, compact_threshold):
+    """Build the tiles drawn for a hand
+    
+    Small hands get one tile per card. Hands larger than compact_threshold
+    get one tile per rank with a "selected/total" badge, so even very large
+    hands need at most 13 tiles.
+    
+    Returns list of (text, text_color, selected, badge, tag) tuples
+    """
+    # Draw every card separately while the hand is small
+    if len(hand) <= compact_threshold:
+        return [
+            (card.get_symbol(),
+             "red" if card.suit in ["Hearts", "Diamonds"] else "black",  # Red for hearts/diamonds
+             i in selected_cards,
+             None,
+             f"card_{i}")
+            for i, card in enumerate(hand)
+        ]
+    
+    # Count cards and selected cards of each rank in a single pass
+    totals = {}
+    selected = {}
+    for i, card in enumerate(hand):
+        totals[card.rank] = totals.get(card.rank, 0) + 1
+        if i in selected_cards:
+            selected[card.rank] = selected.get(card.rank, 0) + 1
+    
+    # One tile per rank held, in rank order
+    return [
+        (rank,
+         "black",
+         rank in selected,
+         f"{selected.get(rank, 0)}/{totals[rank]}",
+         f"rank_{rank}")
+        for rank in ranks if rank in totals
+    ]
+
+class TkCanvasBackend:
+    """Draws on a real Tk canvas"""
+    # Wrap the canvas the hand is drawn on
+    def __init__(self, canvas):
+        self.canvas = canvas
+    
+    # Get the visible size, falling back to 430px height before the first layout
+    def view_size(self):
+        height = self.canvas.winfo_height()
+        return self.canvas.winfo_width(), (height if height > 1 else 430)
+    
+    # Get the canvas y coordinate shown at the top of the view
+    def view_top(self):
+        return self.canvas.canvasy(0)
+    
+    # Remove every drawn item
+    def delete_all(self):
+        self.canvas.delete("all")
+    
+    # Set the scrollable area of the canvas
+    def set_scrollregion(self, width, height):
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+    
+    def create_rectangle(self, x1, y1, x2, y2, **options):
+        self.canvas.create_rectangle(x1, y1, x2, y2, **options)
+    
+    def create_text(self, x, y, **options):
+        self.canvas.create_text(x, y, **options)
+
+class RecordingBackend:
+    """Records draw commands in memory instead of drawing, for checks and benchmarks without a display"""
+    # Create a fake view of the given size, scrolled to view_top
+    def __init__(self, width=984, height=430, view_top=0):
+        # Store the fake view dimensions
+        self.width = width
+        self.height = height
+        self.top = view_top
+        # Draw commands of the current frame as (kind, coords, options) tuples
+        self.commands = []
+        # Number of commands of each kind in the current frame
+        self.counts = {}
+        # Number of frames drawn so far
+        self.redraws = 0
+        # Last scroll region set as (width, height)
+        self.scrollregion = None
+    
+    def view_size(self):
+        return self.width, self.height
+    
+    def view_top(self):
+        return self.top
+    
+    # Start a new frame
+    def delete_all(self):
+        self.commands = []
+        self.counts = {}
+        self.redraws += 1
+    
+    # Set the scroll region, moving the view back inside it like Tk does
+    def set_scrollregion(self, width, height):
+        self.scrollregion = (width, height)
+        self.top = max(0, min(self.top, height - self.height))
+    
+    # Store one command and count it by kind
+    def record(self, kind, coords, options):
+        self.commands.append((kind, coords, options))
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+    
+    def create_rectangle(self, x1, y1, x2, y2, **options):
+        self.record("rectangle", (x1, y1, x2, y2), options)
+    
+    def create_text(self, x, y, **options):
+        self.record("text", (x, y), options)
+
+def draw_hand(backend, tiles):
+    """Draw the visible tiles of a hand on a rendering backend
+    
+    backend: TkCanvasBackend or RecordingBackend
+    tiles: Tiles from build_hand_tiles
+    
+    Returns the HandLayout used, for mapping clicks back to tiles
+    """
+    # Clear the entire canvas before redrawing
+    backend.delete_all()
+    
+    # Lay out all tiles for the current view size
+    view_width, view_height = backend.view_size()
+    layout = HandLayout(len(tiles), view_width, view_height)
+    # Set the scroll region first: a smaller region moves the view, so the
+    # scroll position is only read afterwards
+    backend.set_scrollregion(view_width, layout.scroll_height)
+    layout.set_view_top(backend.view_top())
+    
+    # Draw each visible tile
+    for i in range(layout.first_tile, layout.last_tile):
+        text, text_color, selected, badge, tag = tiles[i]
+        # Calculate pixel coordinates for card placement
+        x, y = layout.tile_position(i)
+        
+        # Draw card background rectangle
+        # Use grey for selected cards, white for unselected
+        color = "#e0e0e0" if selected else "white"
+        backend.create_rectangle(
+            x, y,                          # Top-left corner
+            x + CARD_WIDTH, y + CARD_HEIGHT, # Bottom-right corner
+            fill=color,                     # Background color
+            outline="black",                # Border color
+            width=2,                        # Border width
+            tags=tag                        # Tag with card index or rank for identification
+        )
+        
+        # Add highlight border for selected cards
+        if selected:
+            backend.create_rectangle(
+                x + 2, y + 2,                    # Top-left corner (inset by 2 pixels)
+                x + CARD_WIDTH - 2, y + CARD_HEIGHT - 2,  # Bottom-right corner (inset by 2 pixels)
+                outline="#4CAF50",               # Green highlight color
+                width=3                          # Thick highlight border
+            )
+        
+        # Draw card symbol (e.g., "2♥") or rank on the card
+        font_size = 20  # Fixed font size for card symbols
+        backend.create_text(
+            x + CARD_WIDTH/2,                    # Center horizontally in card
+            y + CARD_HEIGHT/2,                   # Center vertically in card
+            text=text,                           # Card symbol or grouped rank
+            font=("Arial", font_size),           # Arial font with fixed size
+            fill=text_color                      # Red or black based on suit
+        )
+        
+        # Draw the count badge of a grouped rank in the bottom of the card
+        if badge:
+            backend.create_text(
+                x + CARD_WIDTH/2,                # Center horizontally in card
+                y + CARD_HEIGHT - 15,            # Just above the bottom edge
+                text=badge,                      # Selected/total count
+                font=("Arial Bold", 12),         # Small bold font
+                fill="#8B0000"                   # Dark red to stand out
+            )
+    return layout
+
+def benchmark_redraw(hand_size, compact_threshold=40, repeats=100):
+    """Measure draw operations and time per redraw of a hand on the recording backend
+    
+    hand_size: Number of cards in the benchmarked hand (may exceed one deck)
+    compact_threshold: Hand size above which ranks are grouped
+    repeats: Number of redraws to average over
+    
+    Returns (operations per redraw, seconds per redraw)
+    """
+    # Cycle through a sorted deck to build hands of any size
+    hand = [Card(RANKS[(i // 4) % 13], SUITS[i % 4]) for i in range(hand_size)]
+    backend = RecordingBackend()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        draw_hand(backend, build_hand_tiles(hand, set(), RANKS, compact_threshold))
+    elapsed = (time.perf_counter() - start) / repeats
+    return len(backend.commands), elapsed
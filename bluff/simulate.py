@@ -0,0 +1,94 @@
+"""Headless bot-vs-computer games for producing game logs
+
+The player's seat is taken by a simple bot so the computer's strategy
+can be played millions of times without a window. Only the engine is
+imported, never tkinter, so worker processes start quickly.
+"""
+
+# Import random for seeding each simulated game
+import random
+
+from .analytics import format_game_record
+from .engine import BluffGame, COMPUTER
+
+def should_call_bluff(game, rng):
+    """Decide whether the bot in the player's seat challenges the computer's last claim
+    
+    Mirrors computer_decide_bluff: always call impossible claims,
+    otherwise call large claims 30% of the time.
+    """
+    # Nothing to challenge unless the last play is the computer's
+    if not game.plays or game.plays[-1].actor != COMPUTER:
+        return False
+    # Count how many cards of the claimed rank the bot holds itself
+    cards_of_rank = len([card for card in game.player_hand if card.rank == game.current_rank])
+    claimed = game.plays[-1].count
+    if claimed > 4 - cards_of_rank:
+        return True
+    return claimed > 2 and rng.random() > 0.7
+
+def choose_player_cards(game, rng):
+    """Pick the bot's cards: every card of the current rank, else one random card to bluff with
+    
+    Returns set of indices into game.player_hand
+    """
+    matching = {i for i, card in enumerate(game.player_hand) if card.rank == game.current_rank}
+    return matching or {rng.randrange(len(game.player_hand))}
+
+def simulate_game(seed, max_turns=1000):
+    """Play one game between the bot and the computer
+    
+    seed: Seed for the game's own random.Random
+    max_turns: Number of bot turns after which the game is abandoned
+    
+    Returns the game's move records, or None if nobody won within max_turns
+    """
+    rng = random.Random(seed)
+    game = BluffGame(rng=rng)
+    for _ in range(max_turns):
+        # Challenge the computer's claim or play cards, like the two GUI buttons
+        if should_call_bluff(game, rng):
+            game.call_bluff()
+        else:
+            game.play_cards(choose_player_cards(game, rng))
+        if game.check_game_over() is not None:
+            return game.move_log
+    return None
+
+def simulate_games(num_games, seed=0, workers=1):
+    """Simulate games, optionally spread over a pool of worker processes
+    
+    num_games: Number of games to play
+    seed: Seed of the first game, later games use the following seeds
+    workers: Number of processes (1 plays every game in this process)
+    
+    Yields the move records of each finished game, in seed order
+    """
+    seeds = range(seed, seed + num_games)
+    if workers <= 1:
+        results = map(simulate_game, seeds)
+        for moves in results:
+            if moves is not None:
+                yield moves
+        return
+    
+    # Import multiprocessing only when a pool is actually needed
+    import multiprocessing
+    # About four chunks per worker keeps the pool busy without one worker getting every game
+    chunksize = max(1, num_games // (workers * 4))
+    with multiprocessing.Pool(workers) as pool:
+        for moves in pool.imap(simulate_game, seeds, chunksize=chunksize):
+            if moves is not None:
+                yield moves
+
+def write_game_log(games, path):
+    """Append games to a JSON lines log in the format read by analytics.read_game_records
+    
+    Returns the number of games written
+    """
+    count = 0
+    with open(path, "a", encoding="utf-8") as log_file:
+        for moves in games:
+            log_file.write(format_game_record(moves))
+            count += 1
+    return count
@@ -0,0 +1,76 @@
+"""Reading back the .npy shards written by write_feature_shards"""
+
+import ast
+import os
+import sys
+from array import array
+
+from bluff.analytics import (MOVE_FEATURES, format_game_record, iter_move_features,
+                             read_game_records, write_feature_shards)
+
+def make_games(num_games, moves_per_game):
+    # Move records shaped like BluffGame.record_move's, with varied values
+    games = []
+    for game in range(num_games):
+        moves = []
+        for move in range(moves_per_game):
+            moves.append({
+                "actor": move % 2,
+                "claimed_rank": move % 13,
+                "claim_size": 1 + move % 4,
+                "honest": move % 3 != 0,
+                "pile_size": move * 2,
+                "player_hand": 26 - move,
+                "computer_hand": 26 + game,
+                "challenged": move % 5 == 0,
+                "challenge_result": (move % 2) if move % 5 == 0 else -1,
+            })
+        games.append(moves)
+    return games
+
+def read_npy(path, typecode):
+    # Parse a version 1.0 .npy file, returning its header dict and data
+    with open(path, "rb") as npy_file:
+        data = npy_file.read()
+    assert data[:8] == b"\x93NUMPY\x01\x00"
+    header_length = int.from_bytes(data[8:10], "little")
+    # The data starts on a 64 byte boundary after a newline-terminated header
+    assert (10 + header_length) % 64 == 0
+    header = data[10:10 + header_length].decode("latin1")
+    assert header.endswith("\n")
+    column = array(typecode)
+    column.frombytes(data[10 + header_length:])
+    return ast.literal_eval(header), column
+
+def test_shards_read_back_as_the_extracted_rows(tmp_path):
+    games = make_games(num_games=3, moves_per_game=7)
+    log_path = tmp_path / "moves.jsonl"
+    log_path.write_text("".join(format_game_record(moves) for moves in games))
+    out_dir = tmp_path / "features"
+
+    assert write_feature_shards(read_game_records(log_path), out_dir, shard_size=8) == 3
+    assert sorted(os.listdir(out_dir)) == ["shard_00000", "shard_00001", "shard_00002"]
+
+    rows = list(iter_move_features(games))
+    byte_order = "<" if sys.byteorder == "little" else ">"
+    for index, (name, typecode) in enumerate(MOVE_FEATURES):
+        values = []
+        for shard, size in enumerate([8, 8, 5]):
+            header, column = read_npy(out_dir / f"shard_{shard:05d}" / f"{name}.npy", typecode)
+            itemsize = array(typecode).itemsize
+            expected_order = "|" if itemsize == 1 else byte_order
+            assert header == {"descr": f"{expected_order}i{itemsize}",
+                              "fortran_order": False, "shape": (size,)}
+            values.extend(column)
+        assert values == [row[index] for row in rows]
+
+def test_rewriting_removes_stale_shards(tmp_path):
+    out_dir = tmp_path / "features"
+    assert write_feature_shards(make_games(2, 10), out_dir, shard_size=4) == 5
+    # Files that are not shards are left alone
+    (out_dir / "notes.txt").write_text("keep")
+
+    assert write_feature_shards(make_games(1, 3), out_dir, shard_size=4) == 1
+    assert sorted(os.listdir(out_dir)) == ["notes.txt", "shard_00000"]
+    header, _ = read_npy(out_dir / "shard_00000" / "move.npy", "i")
+    assert header["shape"] == (3,)
@@ -0,0 +1,46 @@
+"""Fischer increment and flagging of GameClock, driven by a fake time source"""
+
+from bluff.clock import GameClock
+from bluff.engine import BluffGame, PLAYER, COMPUTER
+
+class FakeTime:
+    # Time that only moves when a test advances it
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+def test_moves_in_time_earn_the_increment():
+    fake = FakeTime()
+    clock = GameClock(10, 2, time_source=fake)
+    clock.start(PLAYER)
+    fake.now = 3
+    assert clock.time_left(PLAYER) == 7
+    assert clock.stop()
+    assert clock.remaining == [9, 10]
+    # The computer's bank only runs during its own move
+    clock.start(COMPUTER)
+    fake.now = 4
+    assert clock.time_left(PLAYER) == 9
+    assert clock.stop()
+    assert clock.remaining == [9, 11]
+
+def test_late_move_flags_without_increment():
+    fake = FakeTime()
+    clock = GameClock(5, 2, time_source=fake)
+    clock.start(PLAYER)
+    fake.now = 6
+    assert clock.is_flagged(PLAYER)
+    assert not clock.stop()
+    assert clock.remaining[PLAYER] == 0
+    assert clock.running is None
+
+def test_player_out_of_time_loses_the_game():
+    fake = FakeTime()
+    game = BluffGame(clock=GameClock(5, time_source=fake))
+    fake.now = 6
+    assert game.check_game_over() == COMPUTER
+    assert game.flagged == PLAYER
+    # No more moves are accepted
+    assert not game.play_cards({0})
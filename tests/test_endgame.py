@@ -0,0 +1,39 @@
+"""Endgame solver answers on tiny positions with known results"""
+
+from bluff.endgame import EndgameSolver, play_options
+
+def counts(**by_rank):
+    # Build a 13-rank count tuple from keyword counts like r2=1, rA=2
+    ranks = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+    return tuple(by_rank.get(f"r{rank}", 0) for rank in ranks)
+
+EMPTY = counts()
+
+def test_play_options_lists_claims_of_one_to_four_cards():
+    assert len(play_options(counts(r2=1, r3=1, r4=1, r5=1, r6=1, r7=1))) == 6 + 15 + 20 + 15
+    assert play_options(counts(r2=1)) == [counts(r2=1)]
+
+def test_plays_every_card_when_that_wins():
+    solver = EndgameSolver()
+    sample = (counts(r9=3), counts(r2=2, rK=1), counts(r5=1), 0, None)
+    assert solver.choose_play([sample], 0.5) == counts(r2=2, rK=1)
+
+def test_calls_a_bluff_on_the_players_last_card():
+    # The player bluffed away their last card: letting it stand loses at once
+    solver = EndgameSolver()
+    sample = (EMPTY, counts(r2=1, r3=1), counts(r9=1), 0, False)
+    assert solver.choose_call([sample], 1.0) is True
+    assert solver.exact
+
+def test_lets_an_honest_claim_stand_when_it_can_win_next():
+    # Calling would hand the computer the pile; playing its last Two wins now
+    solver = EndgameSolver()
+    sample = (counts(rK=1), counts(r2=1), counts(r2=1), 0, True)
+    assert solver.choose_call([sample], 1.0) is False
+    assert solver.exact
+
+def test_transposition_table_stays_within_its_size():
+    solver = EndgameSolver(table_size=50)
+    sample = (counts(r3=2, r7=2, rQ=1), counts(r2=1, r5=2, r8=1, rA=2), counts(r4=2), 0, None)
+    assert solver.choose_play([sample], 0.2) is not None
+    assert len(solver.table) <= 50
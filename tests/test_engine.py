@@ -0,0 +1,85 @@
+"""Rules of BluffGame on fixed hands and piles"""
+
+import random
+
+from bluff.cards import Card
+from bluff.engine import BluffGame, COMPUTER, PLAYER
+
+def cards(*symbols):
+    # Build cards from short names like "7S" or "10H"
+    suits = {"H": "Hearts", "D": "Diamonds", "C": "Clubs", "S": "Spades"}
+    return [Card(symbol[:-1], suits[symbol[-1]]) for symbol in symbols]
+
+def make_game():
+    # A game whose messages are collected instead of shown
+    game = BluffGame(rng=random.Random(0))
+    game.messages = []
+    game.notify = lambda title, message: game.messages.append(title)
+    return game
+
+def test_moves_are_refused_while_another_move_is_resolved():
+    game = make_game()
+    nested = []
+    
+    # Try a second play and a call from inside the first move's messages
+    def notify(title, message):
+        nested.append((game.play_cards({0}), game.call_bluff()))
+    game.notify = notify
+    
+    assert game.play_cards({0})
+    assert nested and all(result == (False, False) for result in nested)
+    assert not game.in_move
+    # Only the first play was made
+    assert [record["actor"] for record in game.move_log].count(PLAYER) == 1
+
+def deal(game, player, computer):
+    # Replace both hands with fixed cards and empty the pile
+    game.player_hand = cards(*player)
+    game.computer_hand = cards(*computer)
+    game.pile = []
+    game.plays = []
+    game.current_rank = "2"
+
+def claim(game, actor, rank, played):
+    # Put cards from the actor's hand on the pile as a claim of rank
+    hand = game.player_hand if actor == PLAYER else game.computer_hand
+    game.current_rank = rank
+    game.push_play(actor, [card for card in hand if card.get_symbol() in played], hand)
+
+def symbols(hand):
+    return sorted(card.get_symbol() for card in hand)
+
+def test_mixed_claim_is_caught():
+    game = make_game()
+    deal(game, ["4C", "9D"], ["7S", "2H", "KD"])
+    claim(game, COMPUTER, "2", {"7♠", "2♥"})
+    
+    assert game.call_bluff()
+    assert game.messages == ["Caught!"]
+    # The computer takes back both cards of the claim
+    assert symbols(game.computer_hand) == symbols(cards("7S", "2H", "KD"))
+    assert game.pile == [] and game.plays == []
+
+def test_honest_claim_over_earlier_plays_is_not_caught():
+    game = make_game()
+    deal(game, ["7C", "4C"], ["3H", "3D", "KD"])
+    # An unchallenged bluff by the player lies underneath the computer's claim
+    claim(game, PLAYER, "2", {"7♣"})
+    claim(game, COMPUTER, "3", {"3♥", "3♦"})
+    
+    assert game.call_bluff()
+    assert game.messages == ["Wrong!"]
+    # The player takes the whole pile, including their own earlier play
+    assert symbols(game.player_hand) == symbols(cards("4C", "7C", "3H", "3D"))
+    assert symbols(game.computer_hand) == ["K♦"]
+
+def test_own_claim_cannot_be_called():
+    game = make_game()
+    deal(game, ["2C", "4C"], ["3H", "KD"])
+    claim(game, PLAYER, "2", {"2♣"})
+    
+    assert not game.call_bluff()
+    assert game.messages == ["Error"]
+    # Nothing moved
+    assert symbols(game.pile) == ["2♣"]
+    assert symbols(game.player_hand) == ["4♣"]
@@ -0,0 +1,48 @@
+"""Rebuilding positions from MoveHistory checkpoints after the ring buffer wraps"""
+
+import random
+
+import pytest
+
+from bluff.engine import BluffGame
+from bluff.history import MoveHistory, unpack_state
+from bluff.simulate import choose_player_cards, should_call_bluff
+
+def play_recording_states(seed, history):
+    # Play a bot game, remembering the real position before each history move
+    rng = random.Random(seed)
+    game = BluffGame(rng=rng, history=history)
+    states = {}
+    for _ in range(300):
+        states[len(history)] = unpack_state(game.packed_state())
+        if should_call_bluff(game, rng):
+            game.call_bluff()
+        else:
+            game.play_cards(choose_player_cards(game, rng))
+        if game.check_game_over() is not None:
+            break
+    states[len(history)] = unpack_state(game.packed_state())
+    return states
+
+@pytest.mark.parametrize("seed", range(5))
+def test_state_at_matches_the_game_after_wrapping(seed):
+    history = MoveHistory(capacity=8, checkpoint_interval=2)
+    states = play_recording_states(seed, history)
+    # The buffer has wrapped several times
+    assert len(history) > 2 * history.capacity
+    assert len(history.checkpoints) <= history.capacity // history.checkpoint_interval + 1
+    for move in range(history.checkpoints[0][0], len(history) + 1):
+        if move in states:
+            assert history.state_at(move) == states[move]
+
+def test_forgotten_moves_cannot_be_rebuilt():
+    history = MoveHistory(capacity=8, checkpoint_interval=2)
+    play_recording_states(0, history)
+    with pytest.raises(ValueError):
+        history.state_at(0)
+    with pytest.raises(ValueError):
+        list(history.moves(0))
+
+def test_interval_larger_than_capacity_is_rejected():
+    with pytest.raises(ValueError):
+        MoveHistory(capacity=4, checkpoint_interval=8)
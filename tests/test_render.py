@@ -0,0 +1,76 @@
+"""Layout, highlighting and click mapping of the hand, checked on the recording backend"""
+
+from bluff.cards import RANKS, SUITS, Card
+from bluff.render import HandLayout, RecordingBackend, build_hand_tiles, draw_hand
+
+def make_hand(size):
+    # Cycle through a sorted deck to build hands of any size
+    return [Card(RANKS[(i // 4) % 13], SUITS[i % 4]) for i in range(size)]
+
+def test_layout_centers_a_full_hand():
+    layout = HandLayout(26, 984, 430)
+    assert layout.cards_per_row == 10
+    assert layout.num_rows == 3
+    assert layout.x_start == 47
+    assert layout.y_start == 15
+    assert layout.scroll_height == 430
+    assert (layout.first_tile, layout.last_tile) == (0, 26)
+
+def test_tile_at_maps_clicks_to_cards_and_gaps():
+    layout = HandLayout(26, 984, 430)
+    assert layout.tile_at(50, 20) == 0
+    assert layout.tile_at(47 + 90 * 3 + 40, 15 + 140 + 60) == 13
+    # Gap between the first two cards and between the first two rows
+    assert layout.tile_at(47 + 85, 20) is None
+    assert layout.tile_at(50, 15 + 125) is None
+    # Left of the grid and past the last card
+    assert layout.tile_at(10, 20) is None
+    assert layout.tile_at(47 + 90 * 6 + 5, 15 + 280 + 5) is None
+
+def test_scrolled_layout_only_draws_visible_rows():
+    backend = RecordingBackend(view_top=700)
+    tiles = build_hand_tiles(make_hand(104), set(), RANKS, compact_threshold=1000)
+    layout = draw_hand(backend, tiles)
+    assert layout.y_start == 20
+    assert backend.scrollregion == (984, 1560)
+    assert (layout.first_tile, layout.last_tile) == (40, 80)
+    # One background rectangle and one symbol per visible card
+    assert backend.counts == {"rectangle": 40, "text": 40}
+    # A click at the top of the view lands in row 5
+    assert layout.tile_at(50, 700 + 25) == 50
+
+def test_selected_tiles_get_a_highlight():
+    backend = RecordingBackend()
+    draw_hand(backend, build_hand_tiles(make_hand(26), {2, 5}, RANKS, compact_threshold=40))
+    highlights = [coords for kind, coords, options in backend.commands
+                  if kind == "rectangle" and options.get("outline") == "#4CAF50"]
+    assert len(highlights) == 2
+    grey = [options["tags"] for kind, coords, options in backend.commands
+            if kind == "rectangle" and options.get("fill") == "#e0e0e0"]
+    assert grey == ["card_2", "card_5"]
+
+def test_large_hands_are_grouped_by_rank():
+    tiles = build_hand_tiles(make_hand(104), {0, 1, 8}, RANKS, compact_threshold=40)
+    assert len(tiles) == 13
+    assert [tile[0] for tile in tiles] == RANKS
+    assert tiles[0][2:] == (True, "2/8", "rank_2")
+    assert tiles[1][2:] == (False, "0/8", "rank_3")
+    assert tiles[2][2:] == (True, "1/8", "rank_4")
+    backend = RecordingBackend()
+    draw_hand(backend, tiles)
+    # Each tile draws its rank and its badge
+    assert backend.counts["text"] == 26
+
+def test_shrinking_hand_redraws_from_the_clamped_scroll_position():
+    # Scrolled down a four-row hand, then the hand shrinks to fit the view
+    backend = RecordingBackend(view_top=280)
+    layout = draw_hand(backend, build_hand_tiles(make_hand(26), set(), RANKS, compact_threshold=40))
+    assert backend.top == 0
+    assert (layout.first_tile, layout.last_tile) == (0, 26)
+    assert backend.counts["rectangle"] == 26
+
+def test_switching_to_compact_mode_while_scrolled_draws_every_rank():
+    backend = RecordingBackend(view_top=700)
+    layout = draw_hand(backend, build_hand_tiles(make_hand(104), set(), RANKS, compact_threshold=40))
+    assert backend.top == 0
+    assert (layout.first_tile, layout.last_tile) == (0, 13)
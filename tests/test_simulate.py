@@ -0,0 +1,22 @@
+"""Headless simulation: no Tk import and the same games with or without a pool"""
+
+import os
+import subprocess
+import sys
+
+from bluff.simulate import simulate_games
+
+def test_headless_modules_do_not_import_tkinter():
+    # A fresh interpreter, since this one may already have loaded tkinter
+    code = ("import sys\n"
+            "import bluff, bluff.simulate, bluff.analytics, bluff.render, bluff.cli\n"
+            "assert 'tkinter' not in sys.modules, sorted(sys.modules)\n")
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code], cwd=repo_root,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+def test_worker_pool_yields_the_same_games_in_order():
+    serial = list(simulate_games(6, seed=3))
+    pooled = list(simulate_games(6, seed=3, workers=2))
+    assert pooled == serial